@@ -17,41 +17,365 @@ Version: 19.0
 """
 
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime, timedelta
 import json
+import html
+import csv
+import gzip
+import io
 import os
 import time
 import logging
-from urllib.parse import urljoin, urlparse, parse_qs
+import logging.handlers
+import queue
+import threading
+from urllib.parse import urljoin, urlparse, parse_qs, parse_qsl, urlencode
 import re
+from functools import lru_cache
+from contextlib import redirect_stdout
 from typing import List, Dict, Optional
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
+from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException, WebDriverException
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.common.action_chains import ActionChains
-import pickle
 import hashlib
+import sys
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+import pickle
+
+# orjson (de)serializes the cache several times faster than the stdlib json
+# module; fall back to json if it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyahocorasick matches every relevance keyword in one C-level pass; fall back
+# to a single compiled regex alternation if it isn't installed.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# lxml is a C parser and several times faster than the stdlib html.parser on
+# job-board sized pages; fall back to html.parser if it isn't installed.
+try:
+    import lxml.html as lxml_html
+    from lxml import etree as lxml_etree
+    HTML_PARSER = "lxml"
+except ImportError:
+    lxml_html = None
+    lxml_etree = None
+    HTML_PARSER = "html.parser"
+
+# Date parsing tables, compiled once rather than on every parse_date() call
+_DIGIT_RE = re.compile(r'(\d+)')
+_DATE_FORMATS = (
+    "%B %d, %Y", "%b %d, %Y", "%Y-%m-%d", "%d/%m/%Y",
+    "%m/%d/%Y", "%d-%m-%Y", "%d %B %Y", "%d %b %Y"
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_absolute_date(date_string: str) -> Optional[datetime]:
+    """Try each known absolute date format (cached - listings repeat the same dates)"""
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_string, fmt)
+        except ValueError:
+            continue
+    return None
+
 
 class KenyaJobScraper:
-    def __init__(self, save_path: str = "C:\\Users\\USER\\Documents\\app\\Jobs\\"):
-        """Initialize the Kenya Job Scraper with optimized settings"""
+    # Only <a href="...job/..."> tags are kept when parsing list pages without
+    # lxml, so BeautifulSoup never builds a tree for the rest of the document
+    JOB_LINK_STRAINER = SoupStrainer("a", href=re.compile(r"/job/"))
+
+    # Column order for the CSV export (every scraper builds records with these keys)
+    JOB_FIELDS = ['job_title', 'link', 'date_posted', 'date_expires',
+                  'qualification', 'years_of_experience', 'location', 'source']
+
+    # Low-cardinality fields whose values repeat across most jobs (shared via sys.intern)
+    INTERNED_FIELDS = ('date_posted', 'date_expires', 'qualification',
+                       'years_of_experience', 'location', 'source')
+
+    # Rewrite the full JSON array only every N saved jobs (plus at end of run)
+    JSON_FLUSH_EVERY = 50
+
+    # Push buffered journal/CSV rows to disk every N saved jobs (plus on every JSON rewrite and at exit)
+    OUTPUT_FLUSH_EVERY = 10
+
+    # Concurrent HTTP fetches for job detail pages (each WebDriver stays on its own thread)
+    DETAIL_FETCH_WORKERS = 8
+
+    # Most HTTP requests in flight to any one host; keyword threads each prefetch
+    # DETAIL_FETCH_WORKERS pages at once, and without a cap they pile onto the same site
+    HOST_FETCH_LIMIT = 8
+
+    # Keyword searches run at the same time on MyJobMag and MyJobsInKenya, each thread driving its own Chrome
+    KEYWORD_WORKERS = 4
+
+    # Scraped job records are reused across runs for this many days before the detail page is fetched again
+    URL_HISTORY_DAYS = 30
+
+    # Search result pages are reused from disk for this many seconds before the site is searched again
+    RESULTS_PAGE_TTL = 3600
+
+    # (report label, cache site name, scrape method) for each job board, in run order
+    SITES = [
+        ('MyJobMag', 'myjobmag', 'scrape_myjobmag'),
+        ('BrighterMonday', 'brightermonday', 'scrape_brightermonday'),
+        ('Fuzu', 'fuzu', 'scrape_fuzu'),
+        ('CareerPoint Kenya', 'careerpointkenya', 'scrape_careerpointkenya'),
+        ('MyJobsInKenya', 'myjobsinkenya', 'scrape_myjobsinkenya')
+    ]
+
+    # Default for sites scraped at the same time, each in its own process with its own Chrome
+    # (and up to KEYWORD_WORKERS more); 1 = one after another, in this process. Opt in with --site-workers
+    SITE_WORKERS = 1
+
+    # Image URL patterns blocked over CDP outside of human verification
+    BLOCKED_IMAGE_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico"]
+
+    # Fonts, media, ad and tracking URL patterns, blocked for the whole run (none are needed for text extraction)
+    BLOCKED_RESOURCE_PATTERNS = [
+        "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm",
+        "*google-analytics*", "*googletagmanager*", "*doubleclick*", "*googlesyndication*",
+        "*facebook.net*", "*facebook.com/tr*", "*hotjar*"
+    ]
+
+    # Stylesheets, blocked only in MyJobMag drivers: they find elements by ID, click through JS,
+    # read page_source and field textContent, and skip handle_popups (without CSS, hidden close
+    # buttons would look visible); elsewhere unstyled hidden fields would fool the visibility lookups
+    BLOCKED_STYLESHEET_PATTERNS = ["*.css"]
+
+    # Popup close targets matched by tag + id/class/attribute
+    POPUP_CSS_SELECTORS = [
+        # Cookie consent
+        "button#onetrust-accept-btn-handler",
+        "button[class*='onetrust-accept-btn-handler']",
+        
+        # Notification popups
+        "button#onesignal-slidedown-cancel-button",
+        "button[class*='onesignal-slidedown-cancel-button']",
+        
+        # Modal closes
+        "img[data-cy='close-modal']",
+        "button[class*='close']",
+        "button[class*='modal-close']",
+        "div[class*='modal-close']",
+        "span[class*='close']",
+        
+        # Android app download popup (Fuzu specific)
+        "div[class*='close-button']",
+        "button[class*='app-download-close']",
+        
+        # Generic close buttons
+        "button[aria-label='Close']",
+        "button[title='Close']",
+    ]
+
+    # Popup close targets that can only be matched by their text
+    POPUP_TEXT_XPATHS = [
+        "//button[contains(text(), 'Accept')]",
+        "//button[contains(text(), 'No Thanks')]",
+        "//button[contains(text(), 'Not Now')]",
+        "//button[contains(text(), '×')]",
+        "//button[contains(text(), '✕')]",
+        "//span[contains(text(), '×')]",
+        "//span[contains(text(), '✕')]",
+    ]
+
+    # Clicks the first visible match of each selector and returns the ones clicked
+    CLOSE_POPUPS_JS = """
+        const isVisible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+        const closed = [];
+        arguments[0].forEach(selector => {
+            const el = document.querySelector(selector);
+            if (el && isVisible(el)) { el.click(); closed.push(selector); }
+        });
+        arguments[1].forEach(xpath => {
+            const el = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            if (el && isVisible(el)) { el.click(); closed.push(xpath); }
+        });
+        return closed;
+    """
+
+    # True once none of the selectors/XPaths in arguments[0] (as returned by CLOSE_POPUPS_JS) is visible
+    POPUPS_GONE_JS = """
+        const isVisible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+        return arguments[0].every(selector => {
+            const el = selector.startsWith('/')
+                ? document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+                : document.querySelector(selector);
+            return !(el && isVisible(el));
+        });
+    """
+
+    # Shared by the lookup helpers below: selectors starting with '/', './' or '(' are XPath,
+    # anything else is CSS and goes straight to querySelectorAll
+    SELECTOR_QUERY_JS = """
+        const query = (selector, context) => {
+            if (/^\\(*\\.?\\//.test(selector)) {
+                const result = document.evaluate(selector, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                const nodes = [];
+                for (let i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+                return nodes;
+            }
+            return context.querySelectorAll(selector);
+        };
+    """
+
+    # Return the first XPath in arguments[0] that matches a visible element (one WebDriver round-trip)
+    FIRST_VISIBLE_XPATH_JS = """
+        const isVisible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+        for (const xpath of arguments[0]) {
+            const el = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            if (el && isVisible(el)) return xpath;
+        }
+        return null;
+    """
+
+    # Fallback selector lists resolved in one WebDriver round-trip, keeping their priority order
+    # (an XPath union would return matches in document order instead); arguments[1] is an
+    # optional context node for relative './/' selectors
+    FIRST_VISIBLE_ELEMENT_JS = SELECTOR_QUERY_JS + """
+        const isVisible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+        const context = arguments[1] || document;
+        for (const selector of arguments[0]) {
+            for (const el of query(selector, context)) {
+                if (isVisible(el) && !el.disabled) return el;
+            }
+        }
+        return null;
+    """
+    FIRST_MATCHING_ELEMENTS_JS = SELECTOR_QUERY_JS + """
+        const context = arguments[1] || document;
+        for (const selector of arguments[0]) {
+            const nodes = query(selector, context);
+            if (nodes.length) return Array.prototype.slice.call(nodes);
+        }
+        return [];
+    """
+
+    # [href, text, card text] for each link in arguments[0]; card text is the first arguments[2] match
+    # inside the link's nearest arguments[1] ancestor (null if none)
+    CARD_LINKS_JS = """
+        return arguments[0].map(link => {
+            const card = link.closest(arguments[1]);
+            const el = card && card.querySelector(arguments[2]);
+            return [link.href || '', (link.innerText || '').trim(), el ? el.innerText.trim() : null];
+        });
+    """
+
+    # CareerPoint listing links, and the enclosing card's publish date (both static HTML)
+    CAREERPOINT_LINKS_XPATH = "//a[contains(@href, '/20') and contains(text(), 'Job')] | //a[contains(@href, '/job/')]"
+    CAREERPOINT_DATE_XPATH = "./ancestor::*[self::article or self::div][1]//time[@class='entry-date published']"
+
+    # [href, title, location, deadline text] for each MyJobsInKenya link in arguments[0], read from
+    # its listing card (null entries when missing)
+    MYJOBSINKENYA_CARD_JS = """
+        const hasDeadline = el => Array.prototype.some.call(el.childNodes, node => node.nodeType === 3 && node.textContent.includes('Deadline'));
+        return arguments[0].map(link => {
+            const fields = [link.href || '', (link.innerText || '').trim()];
+            const card = link.closest("div[class*='job'], div[class*='listing'], div[class*='card']");
+            if (!card) return fields.concat([null, null]);
+            const marker = card.querySelector("i.fa.fa-map-marker");
+            const deadline = Array.prototype.find.call(card.querySelectorAll('*'), hasDeadline);
+            return fields.concat([marker && marker.parentElement ? marker.parentElement.innerText.trim() : null, deadline ? deadline.innerText : null]);
+        });
+    """
+
+    # [href, text, title, date] for each link element in arguments[0] (one round-trip for the whole list);
+    # date is the first short text matched by the optional arguments[1] selectors inside the link
+    LINK_FIELDS_JS = SELECTOR_QUERY_JS + """
+        const dateSelectors = arguments[1] || [];
+        const dateOf = link => {
+            for (const selector of dateSelectors) {
+                const el = query(selector, link)[0];
+                const text = el ? (el.innerText || '').trim() : '';
+                if (text && text.length < 50) return text;
+            }
+            return null;
+        };
+        return arguments[0].map(el => [el.href || '', (el.innerText || '').trim(), el.getAttribute('title') || '', dateOf(el)]);
+    """
+
+    # Set an input's value and fire input/change in one round-trip; the native
+    # setter is used so React-controlled inputs pick the new value up
+    SET_INPUT_VALUE_JS = """
+        const input = arguments[0];
+        const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(input), 'value').set;
+        setter.call(input, arguments[1]);
+        input.dispatchEvent(new Event('input', { bubbles: true }));
+        input.dispatchEvent(new Event('change', { bubbles: true }));
+    """
+
+    # Fuzu human verification page markers
+    VERIFICATION_INDICATORS = [
+        "//div[contains(text(), 'Verifying you are human')]",
+        "//p[contains(text(), 'Verifying you are human')]",
+        "//h1[contains(text(), 'Verifying you are human')]",
+        "//div[contains(@class, 'main-content')]",
+        "//input[@type='checkbox']"
+    ]
+    VERIFICATION_SUCCESS_INDICATORS = [
+        "//div[contains(text(), 'Verification successful')]",
+        "//div[contains(text(), 'Success')]",
+        "//div[contains(@class, 'success')]"
+    ]
+    VERIFICATION_CHECKBOX_XPATHS = [
+        "//input[@type='checkbox']",
+        "//input[@type='checkbox' and contains(@name, 'cf-turnstile')]",
+        "//input[@type='checkbox' and contains(@id, 'cf-chl')]",
+        "//div[contains(@class, 'cf-turnstile')]//input[@type='checkbox']"
+    ]
+    VERIFY_BUTTON_XPATHS = [
+        "//button[contains(text(), 'Verify')]",
+        "//button[contains(text(), 'Continue')]",
+        "//button[contains(text(), 'Submit')]",
+        "//input[@type='submit']",
+        "//button[@type='submit']"
+    ]
+
+    def __init__(self, save_path: str = "C:\\Users\\USER\\Documents\\app\\Jobs\\", worker: bool = False, use_page_cache: bool = True, site_workers: Optional[int] = None):
+        """Initialize the Kenya Job Scraper with optimized settings.
+
+        A worker instance scrapes a single site in a child process; it reads
+        today's files for de-duplication but leaves writing them to the parent.
+        use_page_cache=False always searches the sites instead of reusing
+        recently saved result pages. site_workers overrides SITE_WORKERS."""
         self.save_path = save_path
+        self.site_workers = site_workers or self.SITE_WORKERS
+        self.worker = worker
+        self.use_page_cache = use_page_cache
         self.jobs_data = []
         self.duplicate_urls = set()
         self.today = datetime.now().date()
+        # Day ordinals for the recency checks, computed once instead of per job
+        self.today_ordinal = self.today.toordinal()
+        self.recent_cutoff_ordinal = self.today_ordinal - 7
         
         # File names - single files per day
         self.json_filename = os.path.join(self.save_path, f"kenya_jobs_{self.today.strftime('%Y-%m-%d')}.json")
+        self.jsonl_filename = os.path.join(self.save_path, f"kenya_jobs_{self.today.strftime('%Y-%m-%d')}.jsonl")
         self.csv_filename = os.path.join(self.save_path, f"jobs_{self.today.strftime('%Y-%m-%d')}.csv")
-        self.cache_filename = os.path.join(self.save_path, f"cache_{self.today.strftime('%Y-%m-%d')}.pkl")
+        self.cache_filename = os.path.join(self.save_path, f"cache_{self.today.strftime('%Y-%m-%d')}.json")
         self.dashboard_filename = os.path.join(self.save_path, f"jobs_dashboard_{self.today.strftime('%Y-%m-%d')}.html")
+        # Gzipped: it holds every job record of the last URL_HISTORY_DAYS and keeps growing
+        self.url_history_filename = os.path.join(self.save_path, "scraped_urls.json.gz")
+        self.page_cache_dir = os.path.join(self.save_path, "cache")
         
         # Create save directory if it doesn't exist
         os.makedirs(self.save_path, exist_ok=True)
@@ -59,15 +383,34 @@ class KenyaJobScraper:
         # Setup logging first (before load_existing_data)
         self.setup_logging()
         
+        # Append-mode output handles, opened on the first saved job
+        self._jsonl_fp = None
+        self._csv_fp = None
+        self._csv_writer = None
+        self._unflushed_jobs = 0
+        
         # Load existing data and cache
         self.load_existing_data()
         self.load_cache()
+        self.load_url_history()
+        # Canonical URLs already in today's JSON/journal before this run; unlike duplicate_urls it
+        # never grows, so sibling keyword threads do not affect it. The URL history is left out:
+        # its jobs still have to be re-saved into today's files from get_known_job
+        self.known_urls = frozenset(self.duplicate_urls)
         
-        # Initialize webdriver as None (lazy loading)
+        # Initialize webdriver as None (lazy loading); each thread gets its own
+        # driver, and the lock guards the shared job list and output files
+        self._local = threading.local()
+        self._drivers = []
+        self._lock = threading.RLock()
+        self._host_slots = {}  # host -> BoundedSemaphore(HOST_FETCH_LIMIT)
         self.driver = None
         self.wait = None
         self.long_wait = None  # For human verification
         
+        # Shared HTTP session (keep-alive + connection pooling) for plain page fetches
+        self.setup_session()
+        
         # KEYWORD CONFIGURATION - Update this list to change search terms
         self.search_keywords = [
            "data","officer", "MONITORING",
@@ -84,6 +427,23 @@ class KenyaJobScraper:
         
         # Track run configuration for smarter caching
         self.current_run_config = self.get_current_run_config()
+        self.cache_keys = {site_name: f"{site_name}_{self.current_run_config}" for _, site_name, _ in self.SITES}
+        
+        # Build the relevance keyword matcher once instead of scanning per keyword
+        self.setup_relevance_matcher()
+
+    def setup_relevance_matcher(self):
+        """Compile RELEVANT_KEYWORDS into one matcher (Aho-Corasick automaton when available)"""
+        self._relevance_ac = None
+        self._relevance_re = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.RELEVANT_KEYWORDS:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._relevance_ac = automaton
+        else:
+            self._relevance_re = re.compile("|".join(re.escape(keyword) for keyword in self.RELEVANT_KEYWORDS), re.IGNORECASE)
 
     def get_current_run_config(self) -> str:
         """Generate a hash of current run configuration for cache invalidation"""
@@ -93,37 +453,141 @@ class KenyaJobScraper:
             'version': '19.0'
         }
         config_str = json.dumps(config_data, sort_keys=True)
-        return hashlib.md5(config_str.encode()).hexdigest()
+        # Short, fast digest; it only has to tell run configurations apart
+        return hashlib.blake2s(config_str.encode(), digest_size=8).hexdigest()
 
     def setup_logging(self):
         """Setup logging configuration without unicode characters"""
-        log_filename = os.path.join(self.save_path, f"job_scraper_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+        log_name = f"job_scraper_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        if self.worker:
+            log_name += f"_worker{os.getpid()}"
+        log_filename = os.path.join(self.save_path, f"{log_name}.log")
         
         # Configure logging to handle unicode properly
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_filename, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+        stream_handler = logging.StreamHandler()
+        file_handler.setFormatter(formatter)
+        stream_handler.setFormatter(formatter)
+        
+        # Log calls only enqueue records; a background listener thread does the disk/console IO.
+        # The queue handler is attached (and removed in close()) explicitly: basicConfig would
+        # do nothing for a second scraper in the same process, leaving its listener unfed
+        log_queue = queue.Queue(-1)
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        self._log_queue_handler = logging.handlers.QueueHandler(log_queue)
+        root_logger.addHandler(self._log_queue_handler)
+        self._log_file_handler = file_handler
+        self._log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+        self._log_listener.start()
         self.logger = logging.getLogger(__name__)
         self.logger.info("Enhanced logging system initialized")
 
-    def setup_driver(self):
-        """Setup Selenium WebDriver with optimized settings (lazy loading)"""
+    def setup_session(self):
+        """Setup a pooled requests.Session so repeat fetches to the same host reuse TCP/TLS connections"""
+        self.session = requests.Session()
+        self.session.headers.update({
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+        })
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @property
+    def driver(self):
+        """The calling thread's WebDriver (None until setup_driver runs on that thread)"""
+        return getattr(self._local, 'driver', None)
+
+    @driver.setter
+    def driver(self, value):
+        self._local.driver = value
+
+    @property
+    def wait(self):
+        return getattr(self._local, 'wait', None)
+
+    @wait.setter
+    def wait(self, value):
+        self._local.wait = value
+
+    @property
+    def long_wait(self):
+        return getattr(self._local, 'long_wait', None)
+
+    @long_wait.setter
+    def long_wait(self, value):
+        self._local.long_wait = value
+
+    def close_thread_drivers(self):
+        """Quit the drivers opened by worker threads, keeping the calling thread's one"""
+        with self._lock:
+            drivers = [driver for driver in self._drivers if driver is not self.driver]
+            self._drivers = [driver for driver in self._drivers if driver is self.driver]
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                self.logger.warning(f"Could not close worker WebDriver: {str(e)}")
+
+    def close(self):
+        """Release the WebDriver(s) and HTTP session"""
+        self.close_thread_drivers()
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+            self._drivers = []
+            self.logger.info("WebDriver closed successfully")
+        if self.session:
+            self.session.close()
+            self.session = None
+        self.flush_job_data()
+        for fp in (self._jsonl_fp, self._csv_fp):
+            if fp:
+                fp.close()
+        self._jsonl_fp = self._csv_fp = self._csv_writer = None
+        if self._log_listener:
+            # Detach from the root logger, then drain any queued records before the process exits
+            logging.getLogger().removeHandler(self._log_queue_handler)
+            self._log_listener.stop()
+            self._log_listener = None
+            self._log_file_handler.close()
+
+    def setup_driver(self, headless: bool = False, block_stylesheets: bool = False):
+        """Setup Selenium WebDriver with optimized settings (lazy loading).
+
+        Sites without human verification ask for a headless browser; a visible
+        one serves them too, but a headless one is replaced when a site needs
+        the visible browser. block_stylesheets applies to a newly opened driver."""
         if self.driver is not None:
-            return  # Driver already initialized
+            if headless or not getattr(self._local, 'headless', False):
+                return  # Driver already initialized
+            self.logger.info("Replacing headless WebDriver with a visible one")
+            with self._lock:
+                self._drivers.remove(self.driver)
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
             
         chrome_options = Options()
-        # Use visible browser for better compatibility with human verification
+        # Return from driver.get() once the DOM is ready instead of waiting for every image/tracker
+        chrome_options.page_load_strategy = "eager"
+        if headless:
+            chrome_options.add_argument("--headless=new")
+        # Otherwise use visible browser for better compatibility with human verification
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--window-size=1366,768")
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
         chrome_options.add_argument("--no-first-run")
         chrome_options.add_argument("--disable-default-apps")
         chrome_options.add_argument("--disable-infobars")
@@ -135,7 +599,9 @@ class KenyaJobScraper:
         chrome_options.add_experimental_option("prefs", {
             "profile.default_content_setting_values.notifications": 2,
             "profile.default_content_settings.popups": 0,
-            "profile.managed_default_content_settings.images": 1  # Enable images for human verification
+            # Images stay enabled here so they can be switched back on for human
+            # verification; set_image_blocking() blocks them over CDP the rest of the time
+            "profile.managed_default_content_settings.images": 1
         })
         
         try:
@@ -144,11 +610,36 @@ class KenyaJobScraper:
             self.driver.set_window_size(1366, 768)
             self.wait = WebDriverWait(self.driver, 20)
             self.long_wait = WebDriverWait(self.driver, 45)  # Extended wait for human verification
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+            self._local.block_stylesheets = block_stylesheets
+            self.set_image_blocking(True)
+            self._local.headless = headless
+            with self._lock:
+                self._drivers.append(self.driver)
             self.logger.info("Enhanced WebDriver initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize WebDriver: {str(e)}")
             raise
 
+    def set_image_blocking(self, blocked: bool):
+        """Block (or allow) image downloads in the shared driver via CDP; fonts, media and trackers stay blocked"""
+        urls = self.BLOCKED_RESOURCE_PATTERNS + (self.BLOCKED_IMAGE_PATTERNS if blocked else [])
+        if getattr(self._local, 'block_stylesheets', False):
+            urls = urls + self.BLOCKED_STYLESHEET_PATTERNS
+        try:
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+        except Exception as e:
+            self.logger.warning(f"Could not change image blocking: {str(e)}")
+
+    def sync_session_cookies(self):
+        """Copy the browser's cookies (consent, session) into the HTTP session used for plain page fetches"""
+        try:
+            for cookie in self.driver.get_cookies():
+                self.session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'), path=cookie.get('path', '/'))
+        except Exception as e:
+            self.logger.warning(f"Could not copy browser cookies: {str(e)}")
+
     def load_existing_data(self):
         """Load existing job data from today's files"""
         if os.path.exists(self.json_filename):
@@ -156,10 +647,12 @@ class KenyaJobScraper:
                 with open(self.json_filename, 'r', encoding='utf-8') as f:
                     existing_data = json.load(f)
                     self.jobs_data = existing_data
-                    # Populate duplicate URLs
+                    # Populate duplicate URLs (methods bound once; this runs over every job of the day)
+                    intern_job_fields, canonical_url, seen_urls = self.intern_job_fields, self.canonical_url, self.duplicate_urls
                     for job in existing_data:
-                        if 'link' in job:
-                            self.duplicate_urls.add(job['link'])
+                        intern_job_fields(job)
+                        if job.get('link'):
+                            seen_urls.add(canonical_url(job['link']))
                 if hasattr(self, 'logger'):
                     self.logger.info(f"Loaded {len(self.jobs_data)} existing jobs from today's file")
             except Exception as e:
@@ -168,6 +661,40 @@ class KenyaJobScraper:
         else:
             if hasattr(self, 'logger'):
                 self.logger.info("No existing data file found, starting fresh")
+        self.recover_unflushed_jobs()
+
+    @classmethod
+    def intern_job_fields(cls, job_data: Dict) -> Dict:
+        """Intern repeated field values in place so identical strings share one object"""
+        for field in cls.INTERNED_FIELDS:
+            value = job_data.get(field)
+            if isinstance(value, str):
+                job_data[field] = sys.intern(value)
+        return job_data
+
+    def recover_unflushed_jobs(self):
+        """Replay jobs from the JSON-lines journal that never made it into the JSON file (e.g. after a crash)"""
+        if not os.path.exists(self.jsonl_filename):
+            return
+        recovered = 0
+        try:
+            with open(self.jsonl_filename, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    job = json.loads(line)
+                    if self.is_duplicate_url(job.get('link')):
+                        continue
+                    self.intern_job_fields(job)
+                    self.jobs_data.append(job)
+                    self.mark_url_seen(job.get('link'))
+                    recovered += 1
+        except Exception as e:
+            self.logger.error(f"Error reading JSON journal: {str(e)}")
+        if recovered:
+            self._unflushed_jobs = recovered
+            self.logger.info(f"Recovered {recovered} unflushed jobs from {os.path.basename(self.jsonl_filename)}")
 
     def load_cache(self):
         """Load cached data to avoid repetitive tasks"""
@@ -175,23 +702,133 @@ class KenyaJobScraper:
         if os.path.exists(self.cache_filename):
             try:
                 with open(self.cache_filename, 'rb') as f:
-                    self.cache = pickle.load(f)
+                    raw = f.read()
+                self.cache = orjson.loads(raw) if orjson else json.loads(raw)
                 self.logger.info(f"Loaded cache with {len(self.cache)} entries")
             except Exception as e:
                 self.logger.error(f"Error loading cache: {str(e)}")
                 self.cache = {}
 
+    def load_url_history(self):
+        """Load job records scraped on earlier days, dropping those older than URL_HISTORY_DAYS"""
+        self.url_history = {}
+        # Histories written before compression was added are still picked up
+        legacy_filename = os.path.join(self.save_path, "scraped_urls.json")
+        try:
+            if os.path.exists(self.url_history_filename):
+                with gzip.open(self.url_history_filename, 'rb') as f:
+                    raw = f.read()
+            elif os.path.exists(legacy_filename):
+                with open(legacy_filename, 'rb') as f:
+                    raw = f.read()
+            else:
+                return
+            history = orjson.loads(raw) if orjson else json.loads(raw)
+            cutoff = (self.today - timedelta(days=self.URL_HISTORY_DAYS)).isoformat()
+            self.url_history = {url: entry for url, entry in history.items() if entry.get('scraped', '') >= cutoff}
+            self.logger.info(f"Loaded {len(self.url_history)} previously scraped job URLs")
+        except Exception as e:
+            self.logger.error(f"Error loading URL history: {str(e)}")
+            self.url_history = {}
+
+    def save_url_history(self):
+        """Save the cross-run job URL history"""
+        if self.worker:
+            return
+        try:
+            if orjson:
+                data = orjson.dumps(self.url_history)
+            else:
+                data = json.dumps(self.url_history, ensure_ascii=False).encode('utf-8')
+            # Fastest level: the file is rewritten on every JSON flush, and JSON compresses well even so
+            with gzip.open(self.url_history_filename, 'wb', compresslevel=1) as f:
+                f.write(data)
+        except Exception as e:
+            self.logger.error(f"Error saving URL history: {str(e)}")
+
+    def remember_job(self, job_data: Dict):
+        """Record a saved job in the URL history (keeping the date it was first scraped)"""
+        link = job_data.get('link')
+        if not link:
+            return
+        url = self.canonical_url(link)
+        scraped = self.url_history.get(url, {}).get('scraped', self.today.isoformat())
+        self.url_history[url] = {'scraped': scraped, 'job': job_data}
+
+    def get_known_job(self, url: str) -> Optional[Dict]:
+        """Return a copy of the record scraped for url on an earlier run, if it is still within the TTL"""
+        entry = self.url_history.get(self.canonical_url(url)) if url else None
+        return dict(entry['job']) if entry else None
+
+    def results_page_filename(self, site_name: str, keyword: str, page: int) -> str:
+        """Path of the saved search results page for (site, keyword, page) today"""
+        keyword_hash = hashlib.sha1(keyword.encode('utf-8')).hexdigest()[:12]
+        return os.path.join(self.page_cache_dir, f"{site_name}_{keyword_hash}_p{page}_{self.today.strftime('%Y-%m-%d')}.html.gz")
+
+    def load_results_page(self, site_name: str, keyword: str, page: int) -> Optional[str]:
+        """HTML of a search results page saved within RESULTS_PAGE_TTL, or None"""
+        if not self.use_page_cache:
+            return None
+        filename = self.results_page_filename(site_name, keyword, page)
+        try:
+            if time.time() - os.path.getmtime(filename) > self.RESULTS_PAGE_TTL:
+                return None
+            with gzip.open(filename, 'rt', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Could not read saved results page: {str(e)}")
+            return None
+
+    def save_results_page(self, site_name: str, keyword: str, page: int, html: str):
+        """Save a search results page so a rerun within RESULTS_PAGE_TTL can skip the browser"""
+        try:
+            os.makedirs(self.page_cache_dir, exist_ok=True)
+            with gzip.open(self.results_page_filename(site_name, keyword, page), 'wt', encoding='utf-8') as f:
+                f.write(html)
+        except Exception as e:
+            self.logger.warning(f"Could not save results page: {str(e)}")
+
     def save_cache(self):
         """Save cache data"""
+        if self.worker:
+            return  # The parent merges and saves worker cache entries
         try:
+            if orjson:
+                data = orjson.dumps(self.cache)
+            else:
+                data = json.dumps(self.cache, ensure_ascii=False).encode('utf-8')
             with open(self.cache_filename, 'wb') as f:
-                pickle.dump(self.cache, f)
+                f.write(data)
             self.logger.info("Cache saved successfully")
         except Exception as e:
             self.logger.error(f"Error saving cache: {str(e)}")
 
-    def is_cache_valid_for_run(self, cache_key: str) -> bool:
-        """Check if cache is still valid based on run configuration changes"""
+    def get_site_signature(self, site_url: str, cached_data: Optional[Dict] = None) -> Optional[Dict]:
+        """HEAD the site entry page and return its ETag/Last-Modified (conditional if cached validators exist)"""
+        headers = {}
+        if cached_data:
+            if cached_data.get('etag'):
+                headers['If-None-Match'] = cached_data['etag']
+            if cached_data.get('last_modified'):
+                headers['If-Modified-Since'] = cached_data['last_modified']
+        try:
+            response = self.session.head(site_url, headers=headers, allow_redirects=True, timeout=10)
+        except Exception as e:
+            self.logger.warning(f"Could not check {site_url} for changes: {str(e)}")
+            return None
+        
+        if response.status_code == 304:
+            return {'not_modified': True}
+        return {
+            'not_modified': False,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        }
+
+    def is_cache_valid_for_run(self, cache_key: str, site_url: Optional[str] = None) -> bool:
+        """Check if cache is still valid based on run configuration changes and the site's HTTP validators"""
         if cache_key not in self.cache:
             return False
         
@@ -209,7 +846,16 @@ class KenyaJobScraper:
                 self.logger.info(f"Cache invalid for {cache_key}: date changed")
                 return False
             
-            self.logger.info(f"Cache valid for {cache_key}: using cached data")
+            # Same config and day: ask the site whether anything changed since the cache was written
+            if site_url and (cached_data.get('etag') or cached_data.get('last_modified')):
+                signature = self.get_site_signature(site_url, cached_data)
+                if signature and not signature['not_modified']:
+                    if (signature['etag'], signature['last_modified']) != (cached_data.get('etag'), cached_data.get('last_modified')):
+                        self.logger.info(f"Cache invalid for {cache_key}: site content changed")
+                        return False
+            
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Cache valid for {cache_key}: using cached data")
             return True
         
         return False
@@ -218,60 +864,93 @@ class KenyaJobScraper:
         """Check if job has not expired"""
         expire_date = self.parse_date(date_expires)
         if expire_date:
-            return expire_date.date() >= self.today
+            return expire_date.toordinal() >= self.today_ordinal
         return True  # Include if we can't parse the date
 
     def handle_popups(self):
-        """Enhanced popup handling with better selectors"""
-        popup_handlers = [
-            # Cookie consent
-            ("button", "id", "onetrust-accept-btn-handler"),
-            ("button", "class", "onetrust-accept-btn-handler"),
-            ("button", "text", "Accept"),
-            ("button", "text", "Accept All"),
-            ("button", "text", "I Accept"),
-            
-            # Notification popups
-            ("button", "id", "onesignal-slidedown-cancel-button"),
-            ("button", "class", "onesignal-slidedown-cancel-button"),
-            ("button", "text", "No Thanks"),
-            ("button", "text", "Not Now"),
-            
-            # Modal closes
-            ("img", "data-cy", "close-modal"),
-            ("button", "class", "close"),
-            ("button", "class", "modal-close"),
-            ("div", "class", "modal-close"),
-            ("span", "class", "close"),
-            
-            # Android app download popup (Fuzu specific)
-            ("button", "text", "×"),
-            ("button", "text", "✕"),
-            ("span", "text", "×"),
-            ("span", "text", "✕"),
-            ("div", "class", "close-button"),
-            ("button", "class", "app-download-close"),
-            
-            # Generic close buttons
-            ("button", "aria-label", "Close"),
-            ("button", "title", "Close"),
-        ]
+        """Close cookie/notification/app popups in a single browser round-trip"""
+        try:
+            closed = self.driver.execute_script(self.CLOSE_POPUPS_JS, self.POPUP_CSS_SELECTORS, self.POPUP_TEXT_XPATHS)
+        except Exception as e:
+            self.logger.debug(f"Popup handling skipped: {str(e)}")
+            return
         
-        for tag, attr, value in popup_handlers:
+        for selector in closed or []:
+            self.logger.info(f"Closed popup: {selector}")
+        if closed:
+            # Wait for the closing animations instead of a fixed pause
             try:
-                if attr == "class":
-                    element = self.driver.find_element(By.XPATH, f"//{tag}[contains(@{attr}, '{value}')]")
-                elif attr == "text":
-                    element = self.driver.find_element(By.XPATH, f"//{tag}[contains(text(), '{value}')]")
-                else:
-                    element = self.driver.find_element(By.XPATH, f"//{tag}[@{attr}='{value}']")
-                
-                if element.is_displayed():
-                    self.driver.execute_script("arguments[0].click();", element)
-                    time.sleep(1)
-                    self.logger.info(f"Closed popup: {tag}[@{attr}='{value}']")
-            except (NoSuchElementException, Exception):
-                continue
+                WebDriverWait(self.driver, 2, poll_frequency=0.1).until(
+                    lambda driver: driver.execute_script(self.POPUPS_GONE_JS, closed)
+                )
+            except TimeoutException:
+                pass
+
+    def first_visible_xpath(self, xpaths: List[str]) -> Optional[str]:
+        """Return the first XPath matching a visible element, checked in a single script call"""
+        try:
+            return self.driver.execute_script(self.FIRST_VISIBLE_XPATH_JS, xpaths)
+        except Exception as e:
+            self.logger.debug(f"Visibility check failed: {str(e)}")
+            return None
+
+    def find_first_visible(self, selectors: List[str], context=None):
+        """Return the first visible, enabled element matched by selectors (CSS or XPath, tried in order), or None"""
+        try:
+            return self.driver.execute_script(self.FIRST_VISIBLE_ELEMENT_JS, selectors, context)
+        except Exception as e:
+            self.logger.debug(f"Element lookup failed: {str(e)}")
+            return None
+
+    def find_first_matching(self, selectors: List[str], context=None) -> List:
+        """Return every element matched by the first of selectors (CSS or XPath) that matches anything"""
+        try:
+            return self.driver.execute_script(self.FIRST_MATCHING_ELEMENTS_JS, selectors, context) or []
+        except Exception as e:
+            self.logger.debug(f"Element lookup failed: {str(e)}")
+            return []
+
+    def _click_with_fallbacks(self, element, search_input=None) -> bool:
+        """Click element, falling back to a JS click, submitting its form, then Enter in search_input"""
+        # Scroll to the element to ensure it's in view
+        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+        time.sleep(0.2)
+        
+        # Method 1: Regular click
+        try:
+            element.click()
+            self.logger.info("Successfully clicked search button (regular click)")
+            return True
+        except Exception as e:
+            self.logger.info(f"Regular click failed: {e}")
+        
+        # Method 2: JavaScript click if regular click failed
+        try:
+            self.driver.execute_script("arguments[0].click();", element)
+            self.logger.info("Successfully clicked search button (JavaScript click)")
+            return True
+        except Exception as e:
+            self.logger.info(f"JavaScript click failed: {e}")
+        
+        # Method 3: Submit form if button is in a form
+        try:
+            form = element.find_element(By.XPATH, "./ancestor::form")
+            self.driver.execute_script("arguments[0].submit();", form)
+            self.logger.info("Successfully submitted form")
+            return True
+        except Exception as e:
+            self.logger.info(f"Form submit failed: {e}")
+        
+        # Method 4: Try pressing Enter on the search input
+        if search_input is not None:
+            try:
+                search_input.send_keys(Keys.RETURN)
+                self.logger.info("Successfully pressed Enter on search input")
+                return True
+            except Exception as e:
+                self.logger.info(f"Enter key failed: {e}")
+        
+        return False
 
     def handle_human_verification(self, max_retries: int = 3) -> bool:
         """Enhanced human verification handling specifically for Fuzu"""
@@ -280,73 +959,49 @@ class KenyaJobScraper:
                 self.logger.info(f"Attempting human verification (attempt {attempt + 1}/{max_retries})")
                 
                 # Wait for the page to load completely
-                time.sleep(3)
+                self.wait_for_document_ready()
+                prior_url = self.driver.current_url
                 
                 # Check if we're on a human verification page
-                verification_indicators = [
-                    "//div[contains(text(), 'Verifying you are human')]",
-                    "//p[contains(text(), 'Verifying you are human')]",
-                    "//h1[contains(text(), 'Verifying you are human')]",
-                    "//div[contains(@class, 'main-content')]",
-                    "//input[@type='checkbox']"
-                ]
-                
-                verification_present = False
-                for indicator in verification_indicators:
-                    try:
-                        element = self.driver.find_element(By.XPATH, indicator)
-                        if element.is_displayed():
-                            verification_present = True
-                            self.logger.info(f"Human verification detected: {indicator}")
-                            break
-                    except:
-                        continue
-                
-                if not verification_present:
+                indicator = self.first_visible_xpath(self.VERIFICATION_INDICATORS)
+                if not indicator:
                     self.logger.info("No human verification detected")
                     return True
+                self.logger.info(f"Human verification detected: {indicator}")
                 
                 # Wait for and handle the checkbox
-                checkbox_selectors = [
-                    "//input[@type='checkbox']",
-                    "//input[@type='checkbox' and contains(@name, 'cf-turnstile')]",
-                    "//input[@type='checkbox' and contains(@id, 'cf-chl')]",
-                    "//div[contains(@class, 'cf-turnstile')]//input[@type='checkbox']"
-                ]
-                
                 checkbox_found = False
-                for selector in checkbox_selectors:
+                for selector in self.VERIFICATION_CHECKBOX_XPATHS:
                     try:
-                        self.logger.info(f"Looking for checkbox: {selector}")
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug(f"Looking for checkbox: {selector}")
                         
-                        # Wait for checkbox to be present and clickable
+                        # Wait for checkbox to be present and clickable (visible and enabled)
                         checkbox = self.long_wait.until(
                             EC.element_to_be_clickable((By.XPATH, selector))
                         )
                         
-                        if checkbox.is_displayed() and checkbox.is_enabled():
-                            # Scroll to checkbox
-                            self.driver.execute_script("arguments[0].scrollIntoView(true);", checkbox)
-                            time.sleep(1)
-                            
-                            # Try multiple click methods
+                        # Scroll to checkbox
+                        self.driver.execute_script("arguments[0].scrollIntoView(true);", checkbox)
+                        time.sleep(0.2)
+                        
+                        # Try multiple click methods
+                        try:
+                            checkbox.click()
+                            self.logger.info("Checkbox clicked successfully")
+                        except WebDriverException:
                             try:
-                                checkbox.click()
-                                self.logger.info("Checkbox clicked successfully")
-                            except:
-                                try:
-                                    self.driver.execute_script("arguments[0].click();", checkbox)
-                                    self.logger.info("Checkbox clicked via JavaScript")
-                                except:
-                                    # Try ActionChains
-                                    actions = ActionChains(self.driver)
-                                    actions.move_to_element(checkbox).click().perform()
-                                    self.logger.info("Checkbox clicked via ActionChains")
-                            
-                            checkbox_found = True
-                            time.sleep(2)
-                            break
-                            
+                                self.driver.execute_script("arguments[0].click();", checkbox)
+                                self.logger.info("Checkbox clicked via JavaScript")
+                            except WebDriverException:
+                                # Try ActionChains
+                                actions = ActionChains(self.driver)
+                                actions.move_to_element(checkbox).click().perform()
+                                self.logger.info("Checkbox clicked via ActionChains")
+                        
+                        checkbox_found = True
+                        break
+                        
                     except TimeoutException:
                         self.logger.info(f"Checkbox not found with selector: {selector}")
                         continue
@@ -360,54 +1015,34 @@ class KenyaJobScraper:
                     continue
                 
                 # Look for and click verify/continue button
-                verify_button_selectors = [
-                    "//button[contains(text(), 'Verify')]",
-                    "//button[contains(text(), 'Continue')]",
-                    "//button[contains(text(), 'Submit')]",
-                    "//input[@type='submit']",
-                    "//button[@type='submit']"
-                ]
-                
-                for selector in verify_button_selectors:
+                for selector in self.VERIFY_BUTTON_XPATHS:
                     try:
                         verify_button = self.wait.until(
                             EC.element_to_be_clickable((By.XPATH, selector))
                         )
                         
-                        if verify_button.is_displayed():
-                            self.driver.execute_script("arguments[0].click();", verify_button)
-                            self.logger.info(f"Clicked verify button: {selector}")
-                            time.sleep(3)
-                            break
-                            
-                    except:
+                        self.driver.execute_script("arguments[0].click();", verify_button)
+                        self.logger.info(f"Clicked verify button: {selector}")
+                        break
+                        
+                    except WebDriverException:
                         continue
                 
-                # Wait for verification to complete
+                # Wait for verification to complete (the challenge redirects when it passes)
                 self.logger.info("Waiting for verification to complete...")
-                time.sleep(8)
+                try:
+                    WebDriverWait(self.driver, 15).until(EC.url_changes(prior_url))
+                except TimeoutException:
+                    pass  # Fall through to the on-page success checks
                 
                 # Check if verification was successful
-                success_indicators = [
-                    "//div[contains(text(), 'Verification successful')]",
-                    "//div[contains(text(), 'Success')]",
-                    "//div[contains(@class, 'success')]"
-                ]
-                
-                verification_successful = False
-                for indicator in success_indicators:
-                    try:
-                        element = self.driver.find_element(By.XPATH, indicator)
-                        if element.is_displayed():
-                            verification_successful = True
-                            self.logger.info("Human verification successful!")
-                            break
-                    except:
-                        continue
+                verification_successful = self.first_visible_xpath(self.VERIFICATION_SUCCESS_INDICATORS) is not None
+                if verification_successful:
+                    self.logger.info("Human verification successful!")
                 
                 # Also check if we're redirected away from verification page
-                current_url = self.driver.current_url
-                if "challenge" not in current_url.lower() and "verify" not in current_url.lower():
+                current_url = self.driver.current_url.casefold()
+                if "challenge" not in current_url and "verify" not in current_url:
                     verification_successful = True
                     self.logger.info("Redirected away from verification page - assuming success")
                 
@@ -428,49 +1063,41 @@ class KenyaJobScraper:
 
     def parse_date(self, date_string: str) -> Optional[datetime]:
         """Parse various date formats to datetime object"""
-        if not date_string or date_string.lower() in ['not specified', 'unknown']:
+        if not date_string:
             return None
             
         date_string = date_string.strip()
+        date_lower = date_string.casefold()
+        if date_lower in ('not specified', 'unknown'):
+            return None
         
         # Handle relative dates
-        if 'ago' in date_string.lower():
-            if 'day' in date_string.lower():
-                days = int(re.search(r'(\d+)', date_string).group(1))
-                return datetime.now() - timedelta(days=days)
-            elif 'week' in date_string.lower():
-                weeks = int(re.search(r'(\d+)', date_string).group(1))
-                return datetime.now() - timedelta(weeks=weeks)
-            elif 'hour' in date_string.lower():
+        if 'ago' in date_lower:
+            match = _DIGIT_RE.search(date_string)
+            if 'day' in date_lower:
+                if match:
+                    return datetime.now() - timedelta(days=int(match.group(1)))
+            elif 'week' in date_lower:
+                if match:
+                    return datetime.now() - timedelta(weeks=int(match.group(1)))
+            elif 'hour' in date_lower:
                 return datetime.now()
         
         # Handle absolute dates
-        date_formats = [
-            "%B %d, %Y", "%b %d, %Y", "%Y-%m-%d", "%d/%m/%Y", 
-            "%m/%d/%Y", "%d-%m-%Y", "%d %B %Y", "%d %b %Y"
-        ]
-        
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(date_string, fmt)
-            except ValueError:
-                continue
-        
-        return None
+        return _parse_absolute_date(date_string)
 
     def is_recent_job(self, date_posted: str, date_expires: str = None) -> bool:
         """Check if job was posted within the last 7 days or hasn't expired"""
         # First check posted date
         job_date = self.parse_date(date_posted)
         if job_date:
-            seven_days_ago = self.today - timedelta(days=7)
-            return job_date.date() >= seven_days_ago
+            return job_date.toordinal() >= self.recent_cutoff_ordinal
         
-        # If no posted date, check expiry date
-        if date_expires and date_expires.lower() not in ['not specified', 'unknown']:
+        # If no posted date, check expiry date (parse_date already rejects placeholders)
+        if date_expires:
             expire_date = self.parse_date(date_expires)
             if expire_date:
-                return expire_date.date() >= self.today
+                return expire_date.toordinal() >= self.today_ordinal
         
         # If neither date is available, include the job to avoid missing opportunities
         return True
@@ -496,74 +1123,243 @@ class KenyaJobScraper:
         # If no dates available, continue to next page (don't miss opportunities)
         return True
 
+    def collect_job_links(self, html: str, base_url: str) -> List[Dict]:
+        """Parse job links from a list page's HTML, keeping only job anchors"""
+        if lxml_etree is not None:
+            return list(self.iter_job_links([html], base_url))
+        
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=self.JOB_LINK_STRAINER)
+        links = []
+        for anchor in soup.find_all("a"):
+            href = anchor.get("href")
+            text = anchor.get_text(" ", strip=True)
+            if href and text:
+                links.append({'href': urljoin(base_url, href), 'title': text})
+        return links
+
+    def iter_job_links(self, chunks, base_url: str):
+        """Stream-parse HTML chunks with lxml's pull parser, yielding each job link as soon as its <a> closes.
+
+        Anchors are cleared once read so no subtree is kept around; chunks can
+        be one page_source string or a streamed response's iter_content()."""
+        parser = lxml_etree.HTMLPullParser(events=("end",), tag="a")
+        
+        def drain():
+            for _, elem in parser.read_events():
+                href = elem.get("href") or ""
+                if "/job/" in href:
+                    text = " ".join(" ".join(elem.itertext()).split())
+                    if text:
+                        yield {'href': urljoin(base_url, href), 'title': text}
+                elem.clear()
+        
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from drain()
+        parser.close()
+        yield from drain()
+
+    # Query parameters that only track where a click came from, never which job it is
+    TRACKING_PARAMS = {'fbclid', 'gclid', 'ref'}
+
+    # Memoized: each candidate link is canonicalized for the prefetch filter, the
+    # duplicate check and mark_url_seen, and URL parsing costs far more than the set probe
+    @classmethod
+    @lru_cache(maxsize=16384)
+    def canonical_url(cls, url: str) -> str:
+        """Normalize a job URL (host case, trailing slash, fragment, tracking params) for de-duplication"""
+        parsed = urlparse(url.strip())
+        query = urlencode([
+            (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+            if not k.lower().startswith('utm_') and k.lower() not in cls.TRACKING_PARAMS
+        ])
+        # Path parameters (;...) and blank query values can tell two jobs apart, so both are kept
+        path = parsed.path.rstrip('/') + (f";{parsed.params}" if parsed.params else "")
+        canon = f"{parsed.scheme.lower()}://{parsed.netloc.lower()}{path}"
+        return f"{canon}?{query}" if query else canon
+
+    def is_duplicate_url(self, url: str) -> bool:
+        """Check whether a job URL (in any trivial variation) was already seen"""
+        return bool(url) and self.canonical_url(url) in self.duplicate_urls
+
+    def is_known_url(self, url: str) -> bool:
+        """Check whether a job URL was already in today's output before this run started"""
+        return bool(url) and self.canonical_url(url) in self.known_urls
+
+    def mark_url_seen(self, url: str):
+        """Record a job URL so later variations of it are skipped"""
+        if url:
+            self.duplicate_urls.add(self.canonical_url(url))
+
+    def claim_url(self, url: str) -> bool:
+        """Atomically mark a job URL as seen; False if it was already seen (possibly by another thread)"""
+        with self._lock:
+            if not url or self.is_duplicate_url(url):
+                return False
+            self.mark_url_seen(url)
+            return True
+
     def get_cache_key_with_config(self, site_name: str) -> str:
-        """Generate cache key that includes run configuration"""
-        return f"{site_name}_{self.current_run_config}"
+        """Cache key that includes run configuration (prebuilt per site in __init__)"""
+        return self.cache_keys.get(site_name) or f"{site_name}_{self.current_run_config}"
+
+    def update_site_cache(self, cache_key: str, jobs: List[Dict], site_url: str):
+        """Merge newly scraped jobs into the site's cache entry and record the site's current validators"""
+        cached_jobs = []
+        previous = self.cache.get(cache_key)
+        if isinstance(previous, dict) and previous.get('run_config') == self.current_run_config:
+            # An earlier run today was invalidated by a site change; keep its jobs, add only the new ones
+            cached_jobs = previous.get('jobs', [])
+        
+        seen = {self.canonical_url(job.get('link', '')) for job in cached_jobs}
+        merged_jobs = cached_jobs + [job for job in jobs if self.canonical_url(job.get('link', '')) not in seen]
+        
+        signature = self.get_site_signature(site_url) or {}
+        self.cache[cache_key] = {
+            'jobs': merged_jobs,
+            'run_config': self.current_run_config,
+            'date': self.today.isoformat(),
+            'timestamp': datetime.now().isoformat(),
+            'etag': signature.get('etag'),
+            'last_modified': signature.get('last_modified')
+        }
+        self.save_cache()
+
+    # Keywords that make a job relevant (compiled once by setup_relevance_matcher)
+    RELEVANT_KEYWORDS = [
+        # Core roles & areas
+        'data analyst', 'data analysis', 'statistics', 'statistician',
+        'business intelligence', 'data analytics', 'analytics',
+        'data science', 'data scientist', 'quantitative',
+        'research analyst', 'economic analyst',
+        'monitoring and evaluation', 'm&e',
+        'data engineer',
+
+        # Technical tools & languages
+        'sql', 'python', 'r programming',
+        'tableau', 'power bi', 'excel', 'spss',
+        'database', 'data warehousing', 'etl',
+        'big data', 'hadoop', 'spark',
+
+        # Visualization & reporting
+        'data visualization', 'dashboard', 'reporting',
+        'google data studio', 'google analytics', 'matplotlib',
+        'seaborn', 'plotly',
+
+        # ML & AI buzzwords
+        'machine learning', 'predictive modeling', 'a/b testing',
+        'data mining', 'ml', 'ai tools', 'prompt engineering',
+        'augmented analytics', 'agent workflows',
+
+        # Soft & domain-specific
+        'communication', 'critical thinking', 'problem solving',
+        'attention to detail', 'collaboration', 'project management',
+        'economic analysis', 'financial modeling',
+        'healthcare analytics', 'clinical data management'
+    ]
 
     def is_relevant_job(self, job_title: str, job_description: str = "") -> bool:
         """Check if job is relevant based on title and description"""
-        title_lower = job_title.lower()
-        desc_lower = job_description.lower()
-        
-        relevant_keywords = [
-    # Core roles & areas
-    'data analyst', 'data analysis', 'statistics', 'statistician',
-    'business intelligence', 'data analytics', 'analytics',
-    'data science', 'data scientist', 'quantitative',
-    'research analyst', 'economic analyst',
-    'monitoring and evaluation', 'm&e',
-    'data engineer',
-    
-    # Technical tools & languages
-    'sql', 'python', 'r programming',
-    'tableau', 'power bi', 'excel', 'spss',
-    'database', 'data warehousing', 'etl',
-    'big data', 'hadoop', 'spark',
-    
-    # Visualization & reporting
-    'data visualization', 'dashboard', 'reporting',
-    'google data studio', 'google analytics', 'matplotlib',
-    'seaborn', 'plotly',
-    
-    # ML & AI buzzwords
-    'machine learning', 'predictive modeling', 'a/b testing',
-    'data mining', 'ml', 'ai tools', 'prompt engineering',
-    'augmented analytics', 'agent workflows',
-    
-    # Soft & domain-specific
-    'communication', 'critical thinking', 'problem solving',
-    'attention to detail', 'collaboration', 'project management',
-    'economic analysis', 'financial modeling',
-    'healthcare analytics', 'clinical data management'
-]
-        
-        for keyword in relevant_keywords:
-            if keyword in title_lower or keyword in desc_lower:
-                return True
-        
-        return False
+        return self._has_relevant_keyword(job_title.casefold()) or self._has_relevant_keyword(job_description.casefold())
 
-    def save_job_data(self, job_data: Dict):
-        """Save individual job data immediately to prevent data loss"""
-        self.jobs_data.append(job_data)
-        
-        # Save to JSON file (single file per day)
+    def _has_relevant_keyword(self, text: str) -> bool:
+        """Return True if any RELEVANT_KEYWORDS entry occurs in the (casefolded) text"""
+        if not text:
+            return False
+        if self._relevance_ac is not None:
+            return next(self._relevance_ac.iter(text), None) is not None
+        return self._relevance_re.search(text) is not None
+
+    def open_output_files(self):
+        """Open today's JSON-lines journal and CSV once, in append mode"""
+        if self._csv_writer is not None:
+            return
+        csv_is_new = not os.path.exists(self.csv_filename) or os.path.getsize(self.csv_filename) == 0
+        self._jsonl_fp = open(self.jsonl_filename, 'a', encoding='utf-8')
+        self._csv_fp = open(self.csv_filename, 'a', newline='', encoding='utf-8')
+        self._csv_writer = csv.DictWriter(self._csv_fp, fieldnames=self.JOB_FIELDS, extrasaction='ignore')
+        if csv_is_new:
+            self._csv_writer.writeheader()
+            # Backfill column by column (one pass over the jobs per field) and zip into rows
+            columns = [[job.get(field, '') for job in self.jobs_data] for field in self.JOB_FIELDS]
+            csv.writer(self._csv_fp).writerows(zip(*columns))
+            self._csv_fp.flush()
+
+    def flush_output_files(self):
+        """Write buffered journal and CSV rows through to disk"""
+        for fp in (self._jsonl_fp, self._csv_fp):
+            if fp:
+                try:
+                    fp.flush()
+                except Exception as e:
+                    self.logger.error(f"Error flushing {fp.name}: {str(e)}")
+
+    def flush_job_data(self):
+        """Rewrite today's JSON file from self.jobs_data and clear the journal"""
+        if self.worker or not self._unflushed_jobs:
+            return
+        self.flush_output_files()
         try:
-            with open(self.json_filename, 'w', encoding='utf-8') as f:
-                json.dump(self.jobs_data, f, indent=2, ensure_ascii=False)
+            # Written a record at a time, in the same layout json.dump(indent=2) gives;
+            # json.dump itself falls back to the pure-Python encoder whenever it streams
+            with open(self.json_filename, 'wb', buffering=1 << 20) as f:
+                f.write(b'[')
+                for i, job in enumerate(self.jobs_data):
+                    if orjson:
+                        record = orjson.dumps(job, option=orjson.OPT_INDENT_2)
+                    else:
+                        record = json.dumps(job, indent=2, ensure_ascii=False).encode('utf-8')
+                    f.write(b',\n  ' if i else b'\n  ')
+                    f.write(record.replace(b'\n', b'\n  '))
+                f.write(b'\n]' if self.jobs_data else b']')
+            if self._jsonl_fp:
+                self._jsonl_fp.truncate(0)
+            elif os.path.exists(self.jsonl_filename):
+                os.remove(self.jsonl_filename)
+            self._unflushed_jobs = 0
+            self.save_url_history()
             self.logger.info(f"Updated JSON: {os.path.basename(self.json_filename)}")
         except Exception as e:
             self.logger.error(f"Error saving JSON: {str(e)}")
+
+    def save_job_data(self, job_data: Dict):
+        """Save individual job data immediately to prevent data loss.
+
+        Each job is appended to a JSON-lines journal and to the CSV, so the
+        cost per job stays constant; buffered rows reach the disk every
+        OUTPUT_FLUSH_EVERY jobs, and the full JSON array is only rewritten
+        every JSON_FLUSH_EVERY jobs and when the run finishes."""
+        with self._lock:
+            if self.worker:
+                # Returned to the parent process, which does the saving
+                self.jobs_data.append(self.intern_job_fields(job_data))
+                return
+            try:
+                self.open_output_files()
+            except Exception as e:
+                self.logger.error(f"Error opening output files: {str(e)}")
+            self.jobs_data.append(self.intern_job_fields(job_data))
+            self.remember_job(job_data)
         
-        # Save to CSV file (single file per day)
-        try:
-            df = pd.DataFrame(self.jobs_data)
-            df.to_csv(self.csv_filename, index=False, encoding='utf-8')
-            self.logger.info(f"Updated CSV: {os.path.basename(self.csv_filename)}")
-        except Exception as e:
-            self.logger.error(f"Error saving CSV: {str(e)}")
+            # Append to JSON-lines journal (replayed on the next start if we crash)
+            try:
+                self._jsonl_fp.write(json.dumps(job_data, ensure_ascii=False) + "\n")
+            except Exception as e:
+                self.logger.error(f"Error saving JSON: {str(e)}")
+        
+            # Append to CSV file (single file per day)
+            try:
+                self._csv_writer.writerow(job_data)
+            except Exception as e:
+                self.logger.error(f"Error saving CSV: {str(e)}")
+        
+            self._unflushed_jobs += 1
+            if self._unflushed_jobs >= self.JSON_FLUSH_EVERY:
+                self.flush_job_data()
+            elif self._unflushed_jobs % self.OUTPUT_FLUSH_EVERY == 0:
+                self.flush_output_files()
             
-        self.logger.info(f"Saved job #{len(self.jobs_data)}: {job_data.get('job_title', 'Unknown')}")
+            self.logger.info(f"Saved job #{len(self.jobs_data)}: {job_data.get('job_title', 'Unknown')}")
 
     def scrape_myjobmag(self) -> List[Dict]:
         """Scrape jobs from MyJobMag Kenya with smart date-based pagination"""
@@ -573,224 +1369,368 @@ class KenyaJobScraper:
         try:
             # Check cache with run configuration tracking
             cache_key = self.get_cache_key_with_config("myjobmag")
-            if self.is_cache_valid_for_run(cache_key):
+            if self.is_cache_valid_for_run(cache_key, "https://www.myjobmag.co.ke"):
                 cached_jobs = self.cache[cache_key].get('jobs', [])
                 self.logger.info(f"Using cached MyJobMag data ({len(cached_jobs)} jobs)")
                 return cached_jobs
             
-            # Setup driver if not already done
-            self.setup_driver()
-            
-            # Navigate to MyJobMag homepage
-            self.driver.get("https://www.myjobmag.co.ke")
-            time.sleep(4)
-            
-            # Handle popups
-            self.handle_popups()
-            
-            # Use ALL keywords from configuration
-            keywords_to_use = self.search_keywords
-            
-            # For each search keyword
-            for keyword_idx, keyword in enumerate(keywords_to_use):
-                try:
-                    self.logger.info(f"Searching MyJobMag for keyword {keyword_idx+1}/{len(keywords_to_use)}: {keyword}")
-                    
-                    # Navigate back to homepage for fresh start
-                    if keyword_idx > 0:
-                        self.driver.get("https://www.myjobmag.co.ke")
-                        time.sleep(3)
-                        self.handle_popups()
-                    
-                    # Find search input and enter keyword
-                    search_input = self.wait.until(
-                        EC.presence_of_element_located((By.ID, "search-key"))
-                    )
-                    search_input.clear()
-                    search_input.send_keys(keyword)
-                    time.sleep(1)
-                    
-                    # Click search button
-                    search_btn = self.driver.find_element(By.ID, "search-but")
-                    self.driver.execute_script("arguments[0].click();", search_btn)
-                    time.sleep(4)
-                    
-                    # Smart pagination based on job dates
-                    page = 1
-                    should_continue = True
-                    
-                    while should_continue and page <= 5:  # Max 5 pages safety limit
-                        # Get fresh job links for each page
-                        job_links_data = []
-                        page_jobs = []  # Track jobs on this page for date checking
-                        
-                        # Collect job link data first
-                        try:
-                            job_link_elements = self.driver.find_elements(By.XPATH, "//a[contains(@href, '/job/')]")
-                            
-                            for elem in job_link_elements:  # Don't limit on page 1, especially
-                                try:
-                                    href = elem.get_attribute('href')
-                                    text = elem.text.strip()
-                                    if href and text and self.is_relevant_job(text):
-                                        job_links_data.append({'href': href, 'title': text})
-                                except:
-                                    continue
-                        except Exception as e:
-                            self.logger.error(f"Error collecting job links: {str(e)}")
-                            break
-                        
-                        self.logger.info(f"Page {page}: Found {len(job_links_data)} relevant job links for '{keyword}'")
-                        
-                        # Process each job link
-                        for job_data in job_links_data:
-                            try:
-                                job_link = job_data['href']
-                                job_title = job_data['title']
-                                
-                                if job_link in self.duplicate_urls:
-                                    continue
-                                
-                                # Navigate directly to job page
-                                self.driver.get(job_link)
-                                time.sleep(3)
-                                
-                                # Extract job details
-                                extracted_data = self.extract_myjobmag_job_details(job_title, job_link)
-                                
-                                if extracted_data:
-                                    # Check if job is older than 7 days - if so, stop immediately
-                                    if extracted_data['date_posted'] != 'Not specified':
-                                        if not self.is_recent_job(extracted_data['date_posted']):
-                                            self.logger.info(f"Job older than 7 days detected: {job_title}. Stopping page scraping.")
-                                            should_continue = False
-                                            break
-                                    
-                                    # Check if job has expired - if so, stop immediately
-                                    if extracted_data['date_expires'] != 'Not specified':
-                                        if not self.is_not_expired(extracted_data['date_expires']):
-                                            self.logger.info(f"Expired job detected: {job_title}. Stopping page scraping.")
-                                            should_continue = False
-                                            break
-                                    
-                                    page_jobs.append(extracted_data)  # Track for date checking
-                                    
-                                    # Use improved date checking
-                                    if self.is_recent_job(extracted_data['date_posted'], extracted_data['date_expires']) and self.is_not_expired(extracted_data['date_expires']):
-                                        self.duplicate_urls.add(job_link)
-                                        self.save_job_data(extracted_data)
-                                        jobs.append(extracted_data)
-                                
-                            except Exception as e:
-                                self.logger.error(f"Error processing MyJobMag job: {str(e)}")
-                                continue
-                        
-                        # If we detected old/expired jobs, stop pagination
-                        if not should_continue:
-                            break
-                        
-                        # Smart pagination decision - check if should continue to next page
-                        if page_jobs:
-                            should_continue = self.should_continue_to_next_page(page_jobs)
-                            if not should_continue:
-                                self.logger.info(f"Stopping pagination for '{keyword}' - older jobs detected on page {page}")
-                        
-                        # Try to go to next page if should continue
-                        if should_continue:
-                            try:
-                                # Go back to search results
-                                self.driver.back()
-                                time.sleep(2)
-                                
-                                next_page_link = self.driver.find_element(By.XPATH, f"//a[@href='/page/{page + 1}' or contains(text(), '{page + 1}')]")
-                                self.driver.execute_script("arguments[0].click();", next_page_link)
-                                time.sleep(3)
-                                page += 1
-                            except:
-                                should_continue = False
-                    
-                except Exception as e:
-                    self.logger.error(f"Error searching MyJobMag for '{keyword}': {str(e)}")
-                    continue
+            # Keyword searches are independent; run them side by side, one browser per thread
+            jobs.extend(self.run_keyword_searches(self._scrape_myjobmag_keyword))
                     
         except Exception as e:
             self.logger.error(f"Error in MyJobMag scraping: {str(e)}")
         
-        # Cache results with run configuration
-        self.cache[cache_key] = {
-            'jobs': jobs,
-            'run_config': self.current_run_config,
-            'date': self.today.isoformat(),
-            'timestamp': datetime.now().isoformat()
-        }
-        self.save_cache()
+        # Cache results with run configuration and the site's HTTP validators
+        self.update_site_cache(cache_key, jobs, "https://www.myjobmag.co.ke")
         
         self.logger.info(f"MyJobMag scraping completed. Found {len(jobs)} relevant jobs")
         return jobs
 
-    def extract_myjobmag_job_details(self, job_title: str, job_link: str) -> Optional[Dict]:
-        """Extract detailed job information from MyJobMag job page"""
+    def run_keyword_searches(self, search_keyword) -> List[Dict]:
+        """Run search_keyword(keyword_idx, keyword, keyword_count) for every search keyword on
+        KEYWORD_WORKERS threads and collect the jobs they return"""
+        jobs = []
+        keywords_to_use = self.search_keywords
         try:
-            job_data = {
-                'job_title': job_title,
-                'link': job_link,
-                'date_posted': 'Not specified',
-                'date_expires': 'Not specified',
-                'qualification': 'Not specified',
-                'years_of_experience': 'Not specified',
-                'location': 'Not specified',
-                'source': 'MyJobMag Kenya'
-            }
+            with ThreadPoolExecutor(max_workers=self.KEYWORD_WORKERS) as executor:
+                futures = [
+                    executor.submit(search_keyword, keyword_idx, keyword, len(keywords_to_use))
+                    for keyword_idx, keyword in enumerate(keywords_to_use)
+                ]
+                for future in as_completed(futures):
+                    jobs.extend(future.result())
+        finally:
+            self.close_thread_drivers()
+        return jobs
+
+    def _scrape_myjobmag_keyword(self, keyword_idx: int, keyword: str, keyword_count: int) -> List[Dict]:
+        """Search MyJobMag for one keyword and page through its results on this thread's driver"""
+        jobs = []
+        try:
+            self.logger.info(f"Searching MyJobMag for keyword {keyword_idx+1}/{keyword_count}: {keyword}")
             
-            # Extract date posted
-            try:
-                posted_elem = self.driver.find_element(By.ID, "posted-date")
-                posted_text = posted_elem.text
-                if 'Posted:' in posted_text:
-                    job_data['date_posted'] = posted_text.split('Posted:')[1].strip()
-            except:
-                # Alternative selector
-                try:
-                    posted_elem = self.driver.find_element(By.XPATH, "//div[contains(@class, 'read-date-sec-li') and contains(text(), 'Posted')]")
-                    posted_text = posted_elem.text
-                    if 'Posted:' in posted_text:
-                        job_data['date_posted'] = posted_text.split('Posted:')[1].strip()
-                except:
-                    pass
-            
-            # Extract deadline
-            try:
-                deadline_elem = self.driver.find_element(By.XPATH, "//div[@class='read-date-sec-li']//b[contains(text(), 'Deadline:')]//parent::div")
-                deadline_text = deadline_elem.text
-                if 'Deadline:' in deadline_text:
-                    job_data['date_expires'] = deadline_text.split('Deadline:')[1].strip()
-            except:
-                pass
+            # Smart pagination based on job dates
+            page = 1
+            browser_page = 0  # Results page currently loaded in this thread's browser (0 = none)
+            should_continue = True
             
-            # Extract qualification
-            try:
-                qual_links = self.driver.find_elements(By.XPATH, "//span[@class='jkey-info']//a[contains(@href, '/jobs-by-education/')]")
-                qualifications = [link.text.strip() for link in qual_links]
-                if qualifications:
-                    job_data['qualification'] = ', '.join(qualifications)
-            except:
-                pass
+            while should_continue and page <= 5:  # Max 5 pages safety limit
+                # Get fresh job links for each page
+                job_links_data = []
+                page_jobs = []  # Track jobs on this page for date checking
+                
+                # A results page saved by a recent run stands in for the browser
+                html = self.load_results_page("myjobmag", keyword, page)
+                if html is None:
+                    if not self.open_myjobmag_results(keyword, page, browser_page):
+                        break
+                    browser_page = page
+                    html = self.driver.page_source
+                    self.save_results_page("myjobmag", keyword, page, html)
+                else:
+                    self.logger.info(f"Using saved MyJobMag results page {page} for '{keyword}'")
+                
+                # Collect job link data first (one page_source read, stream-parsed,
+                # instead of two WebDriver round-trips per link)
+                try:
+                    for link in self.collect_job_links(html, "https://www.myjobmag.co.ke"):
+                        if self.is_relevant_job(link['title']):
+                            job_links_data.append(link)
+                except Exception as e:
+                    self.logger.error(f"Error collecting job links: {str(e)}")
+                    break
+                
+                self.logger.info(f"Page {page}: Found {len(job_links_data)} relevant job links for '{keyword}'")
+                
+                # Every job on this page was already in today's output when the run started, so later
+                # (older) pages were too; URLs other keyword threads claimed this run say nothing
+                # about the pages after it, and jobs known only from the history still need saving
+                if job_links_data and all(self.is_known_url(job_data['href']) for job_data in job_links_data):
+                    self.logger.info(f"No new MyJobMag jobs on page {page} for '{keyword}', stopping pagination")
+                    break
+                
+                # Download this page's new detail pages concurrently over HTTP
+                # (jobs already scraped on an earlier run are reused from the URL history)
+                prefetched_pages = self.prefetch_job_pages([
+                    job_data['href'] for job_data in job_links_data
+                    if not self.is_duplicate_url(job_data['href']) and not self.get_known_job(job_data['href'])
+                ])
+                
+                # Process each job link
+                for job_data in job_links_data:
+                    try:
+                        job_link = job_data['href']
+                        job_title = job_data['title']
+                        
+                        if self.is_duplicate_url(job_link):
+                            continue
+                        
+                        # Extract job details (earlier run, prefetched HTML, browser only as fallback)
+                        extracted_data = self.get_known_job(job_link) or self.fetch_myjobmag_job_details(job_title, job_link, prefetched_pages.get(job_link))
+                        
+                        if extracted_data:
+                            # Check if job is older than 7 days - if so, stop immediately
+                            if extracted_data['date_posted'] != 'Not specified':
+                                if not self.is_recent_job(extracted_data['date_posted']):
+                                    self.logger.info(f"Job older than 7 days detected: {job_title}. Stopping page scraping.")
+                                    should_continue = False
+                                    break
+                            
+                            # Check if job has expired - if so, stop immediately
+                            if extracted_data['date_expires'] != 'Not specified':
+                                if not self.is_not_expired(extracted_data['date_expires']):
+                                    self.logger.info(f"Expired job detected: {job_title}. Stopping page scraping.")
+                                    should_continue = False
+                                    break
+                            
+                            page_jobs.append(extracted_data)  # Track for date checking
+                            
+                            # Both date checks above passed, which already implies
+                            # is_recent_job(posted, expires) and is_not_expired(expires)
+                            if self.claim_url(job_link):
+                                self.save_job_data(extracted_data)
+                                jobs.append(extracted_data)
+                        
+                    except Exception as e:
+                        self.logger.error(f"Error processing MyJobMag job: {str(e)}")
+                        continue
+                
+                # If we detected old/expired jobs, stop pagination
+                if not should_continue:
+                    break
+                
+                # Smart pagination decision - check if should continue to next page
+                if page_jobs:
+                    should_continue = self.should_continue_to_next_page(page_jobs)
+                    if not should_continue:
+                        self.logger.info(f"Stopping pagination for '{keyword}' - older jobs detected on page {page}")
+                
+                # Go to next page if should continue (opened in the browser only when it was not saved)
+                if should_continue:
+                    page += 1
             
-            # Extract experience
+        except Exception as e:
+            self.logger.error(f"Error searching MyJobMag for '{keyword}': {str(e)}")
+        
+        return jobs
+
+    def open_myjobmag_results(self, keyword: str, page: int, browser_page: int) -> bool:
+        """Load results page `page` for keyword in this thread's browser, paging on from browser_page
+        (the results page it is showing, 0 for none) or searching again; False if there is no such page"""
+        if browser_page == 0 or browser_page >= page:
+            # Each worker thread drives its own browser, opened on its first search
+            self.setup_driver(headless=True, block_stylesheets=True)
+            self.driver.get("https://www.myjobmag.co.ke")
+            self.wait.until(EC.presence_of_element_located((By.ID, "search-key")))
+            if not getattr(self._local, 'block_stylesheets', False):
+                self.handle_popups()  # Unstyled popups do not cover the page (see BLOCKED_STYLESHEET_PATTERNS)
+            
+            # Detail pages are fetched over HTTP; let them carry the browser's cookies
+            self.sync_session_cookies()
+            
+            # Find search input and enter keyword
+            search_input = self.wait.until(
+                EC.presence_of_element_located((By.ID, "search-key"))
+            )
+            search_input.clear()
+            search_input.send_keys(keyword)
+            
+            # Click search button
+            search_btn = self.driver.find_element(By.ID, "search-but")
+            self.driver.execute_script("arguments[0].click();", search_btn)
+            self.wait_for_job_links(search_btn)
+            browser_page = 1
+        
+        # Detail pages never leave this tab, so the results page is still loaded
+        while browser_page < page:
             try:
-                exp_elem = self.driver.find_element(By.XPATH, "//span[@class='jkey-title' and text()='Experience']/following-sibling::span[@class='jkey-info']")
-                job_data['years_of_experience'] = exp_elem.text.strip()
-            except:
-                pass
-            
-            # Extract location
+                next_page_link = self.driver.find_element(By.XPATH, f"//a[@href='/page/{browser_page + 1}' or contains(text(), '{browser_page + 1}')]")
+                self.driver.execute_script("arguments[0].click();", next_page_link)
+                self.wait_for_job_links(next_page_link)
+                browser_page += 1
+            except WebDriverException:
+                return False
+        return True
+
+    def fetch_job_page(self, url: str):
+        """GET a page with the shared session and parse it with lxml (None if unavailable).
+
+        Only touches self.session, never the WebDriver, so it is safe to run from worker threads."""
+        if lxml_html is None:
+            return None
+        try:
+            with self.host_slot(url):
+                response = self.session.get(url, timeout=15)
+            if response.status_code == 200:
+                return lxml_html.fromstring(response.content)
+            self.logger.info(f"HTTP {response.status_code} for {url}, using browser")
+        except Exception as e:
+            self.logger.warning(f"HTTP fetch failed for {url}, using browser: {str(e)}")
+        return None
+
+    def host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Semaphore limiting concurrent requests to url's host to HOST_FETCH_LIMIT"""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.HOST_FETCH_LIMIT)
+        return slot
+
+    def prefetch_job_pages(self, urls: List[str]) -> Dict:
+        """Fetch several job pages concurrently, returning {url: parsed page or None}"""
+        urls = list(dict.fromkeys(urls))
+        if lxml_html is None or not urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=self.DETAIL_FETCH_WORKERS) as executor:
+            return dict(zip(urls, executor.map(self.fetch_job_page, urls)))
+
+    def wait_for_document_ready(self, timeout: int = 20) -> bool:
+        """Wait until the current document has finished loading"""
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                lambda driver: driver.execute_script("return document.readyState") == "complete"
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def wait_ready(self, xpath: str, stale_element=None, timeout: int = 10) -> bool:
+        """Wait until xpath matches an element (after stale_element's page has gone, if given)"""
+        try:
+            if stale_element is not None:
+                WebDriverWait(self.driver, timeout).until(EC.staleness_of(stale_element))
+            WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located((By.XPATH, xpath)))
+            return True
+        except TimeoutException:
+            # No match (or an in-place update); the page is used as-is
+            return False
+
+    def wait_for_job_links(self, stale_element=None, timeout: int = 10) -> bool:
+        """Wait until a results page with job links is showing (after stale_element's page has gone, if given)"""
+        return self.wait_ready("//a[contains(@href, '/job')]", stale_element, timeout)
+
+    def fetch_myjobmag_job_details(self, job_title: str, job_link: str, tree=None) -> Optional[Dict]:
+        """Extract MyJobMag job details from a prefetched page, falling back to Selenium when it is missing"""
+        if tree is not None:
+            return self.extract_myjobmag_job_details_from_html(tree, job_title, job_link)
+        
+        # Open the page in a throwaway tab so the search results stay loaded behind it
+        # (the results themselves may have come from disk, leaving no browser yet)
+        self.setup_driver(headless=True, block_stylesheets=True)
+        results_handle = self.driver.current_window_handle
+        self.driver.switch_to.new_window('tab')
+        try:
+            self.driver.get(job_link)
             try:
-                location_elem = self.driver.find_element(By.XPATH, "//span[@class='jkey-title' and text()='Location']/following-sibling::span//a")
-                job_data['location'] = location_elem.text.strip()
-            except:
-                pass
+                WebDriverWait(self.driver, 5).until(
+                    EC.presence_of_element_located((By.XPATH, "//span[@class='jkey-info']"))
+                )
+            except TimeoutException:
+                pass  # Extract whatever fields the page does have
+            return self.extract_myjobmag_job_details(job_title, job_link)
+        finally:
+            self.driver.close()
+            self.driver.switch_to.window(results_handle)
+
+    @staticmethod
+    def _node_text(node) -> str:
+        """Whitespace-normalized text of an lxml node (what Selenium's .text would show)"""
+        return " ".join(node.text_content().split())
+
+    # MyJobMag detail-page field XPaths, shared by the lxml and in-browser extractors
+    MYJOBMAG_FIELD_XPATHS = {
+        'posted': "//div[contains(@class, 'read-date-sec-li') and contains(text(), 'Posted')]",
+        'deadline': "//div[@class='read-date-sec-li']//b[contains(text(), 'Deadline:')]//parent::div",
+        'qualifications': "//span[@class='jkey-info']//a[contains(@href, '/jobs-by-education/')]",
+        'experience': "//span[@class='jkey-title' and text()='Experience']/following-sibling::span[@class='jkey-info']",
+        'location': "//span[@class='jkey-title' and text()='Location']/following-sibling::span//a"
+    }
+
+    # The same XPaths compiled once for the lxml extractor (plus the posted-date id lookup)
+    MYJOBMAG_COMPILED_XPATHS = {
+        name: lxml_etree.XPath(xpath)
+        for name, xpath in dict(MYJOBMAG_FIELD_XPATHS, posted_id="//*[@id='posted-date']").items()
+    } if lxml_etree is not None else {}
+
+    # Read every MyJobMag field from the open page in one script call (arguments[0] = MYJOBMAG_FIELD_XPATHS);
+    # whitespace-normalized textContent, as _node_text gives, since innerText depends on the (blocked) CSS
+    MYJOBMAG_FIELDS_JS = """
+        const xpaths = arguments[0];
+        const text = el => el ? el.textContent.trim().split(/\\s+/).join(' ') : null;
+        const first = xpath => document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        const all = xpath => {
+            const result = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const texts = [];
+            for (let i = 0; i < result.snapshotLength; i++) texts.push(text(result.snapshotItem(i)));
+            return texts;
+        };
+        return {
+            posted: text(document.getElementById('posted-date') || first(xpaths.posted)),
+            deadline: text(first(xpaths.deadline)),
+            qualifications: all(xpaths.qualifications),
+            experience: text(first(xpaths.experience)),
+            location: text(first(xpaths.location))
+        };
+    """
+
+    def build_myjobmag_job(self, job_title: str, job_link: str, fields: Dict) -> Dict:
+        """Turn the raw MyJobMag field texts into a job record"""
+        job_data = {
+            'job_title': job_title,
+            'link': job_link,
+            'date_posted': 'Not specified',
+            'date_expires': 'Not specified',
+            'qualification': 'Not specified',
+            'years_of_experience': 'Not specified',
+            'location': 'Not specified',
+            'source': 'MyJobMag Kenya'
+        }
+        
+        posted_text = fields.get('posted') or ''
+        if 'Posted:' in posted_text:
+            job_data['date_posted'] = posted_text.split('Posted:')[1].strip()
+        
+        deadline_text = fields.get('deadline') or ''
+        if 'Deadline:' in deadline_text:
+            job_data['date_expires'] = deadline_text.split('Deadline:')[1].strip()
+        
+        if fields.get('qualifications'):
+            job_data['qualification'] = ', '.join(fields['qualifications'])
+        if fields.get('experience'):
+            job_data['years_of_experience'] = fields['experience']
+        if fields.get('location'):
+            job_data['location'] = fields['location']
+        
+        return job_data
+
+    def extract_myjobmag_job_details_from_html(self, tree, job_title: str, job_link: str) -> Optional[Dict]:
+        """Extract detailed job information from a parsed MyJobMag job page"""
+        try:
+            xpaths = self.MYJOBMAG_COMPILED_XPATHS
+            
+            def first_text(name):
+                nodes = xpaths[name](tree)
+                return self._node_text(nodes[0]) if nodes else None
+            
+            fields = {
+                'posted': first_text('posted_id') or first_text('posted'),
+                'deadline': first_text('deadline'),
+                'qualifications': [self._node_text(link) for link in xpaths['qualifications'](tree)],
+                'experience': first_text('experience'),
+                'location': first_text('location')
+            }
+            return self.build_myjobmag_job(job_title, job_link, fields)
             
-            return job_data
+        except Exception as e:
+            self.logger.error(f"Error extracting MyJobMag job details: {str(e)}")
+            return None
+
+    def extract_myjobmag_job_details(self, job_title: str, job_link: str) -> Optional[Dict]:
+        """Extract detailed job information from the MyJobMag job page open in the browser"""
+        try:
+            fields = self.driver.execute_script(self.MYJOBMAG_FIELDS_JS, self.MYJOBMAG_FIELD_XPATHS) or {}
+            return self.build_myjobmag_job(job_title, job_link, fields)
             
         except Exception as e:
             self.logger.error(f"Error extracting MyJobMag job details: {str(e)}")
@@ -804,17 +1744,17 @@ class KenyaJobScraper:
         try:
             # Check cache with run configuration tracking
             cache_key = self.get_cache_key_with_config("brightermonday")
-            if self.is_cache_valid_for_run(cache_key):
+            if self.is_cache_valid_for_run(cache_key, "https://www.brightermonday.co.ke"):
                 cached_jobs = self.cache[cache_key].get('jobs', [])
                 self.logger.info(f"Using cached BrighterMonday data ({len(cached_jobs)} jobs)")
                 return cached_jobs
             
             # Setup driver if not already done
-            self.setup_driver()
+            self.setup_driver(headless=True)
             
             # Navigate to BrighterMonday homepage
             self.driver.get("https://www.brightermonday.co.ke")
-            time.sleep(4)
+            self.wait_for_document_ready()
             
             # Handle popups
             self.handle_popups()
@@ -829,25 +1769,22 @@ class KenyaJobScraper:
                 ]
                 
                 navigation_success = False
-                for selector in find_job_selectors:
-                    try:
-                        find_job_btn = self.driver.find_element(By.XPATH, selector)
-                        self.driver.execute_script("arguments[0].click();", find_job_btn)
-                        time.sleep(3)
-                        navigation_success = True
-                        self.logger.info("Successfully clicked 'Find a Job' button")
-                        break
-                    except:
-                        continue
+                find_job_buttons = self.find_first_matching(find_job_selectors)
+                if find_job_buttons:
+                    find_job_btn = find_job_buttons[0]
+                    self.driver.execute_script("arguments[0].click();", find_job_btn)
+                    self.wait_for_job_links(find_job_btn)
+                    navigation_success = True
+                    self.logger.info("Successfully clicked 'Find a Job' button")
                 
                 if not navigation_success:
                     self.driver.get("https://www.brightermonday.co.ke/jobs")
-                    time.sleep(3)
+                    self.wait_for_job_links()
                     
             except Exception as e:
                 self.logger.error(f"Error navigating to jobs page: {str(e)}")
                 self.driver.get("https://www.brightermonday.co.ke/jobs")
-                time.sleep(3)
+                self.wait_for_job_links()
             
             # Handle popups again
             self.handle_popups()
@@ -862,60 +1799,47 @@ class KenyaJobScraper:
                     
                     # Try multiple search strategies
                     search_selectors = [
-                        "//input[@placeholder='Search']",
-                        "//input[contains(@class, 'search')]",
-                        "//input[@type='text' and not(@style) and not(@hidden)]",
+                        "input[placeholder='Search']",
+                        "input[class*='search']",
+                        "input[type='text']:not([style]):not([hidden])",
                         "//div[contains(text(), 'Filter Results')]//following::input[@type='text'][1]",
-                        "//form//input[@type='text']",
-                        "//input[@name='search']"
+                        "form input[type='text']",
+                        "input[name='search']"
                     ]
                     
-                    search_input = None
-                    for selector in search_selectors:
-                        try:
-                            search_input = self.driver.find_element(By.XPATH, selector)
-                            if search_input.is_displayed() and search_input.is_enabled():
-                                # Wait for element to be truly interactable
-                                self.wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
-                                break
-                        except:
-                            continue
+                    search_input = self.find_first_visible(search_selectors)
                     
                     if search_input:
                         search_input.clear()
                         search_input.send_keys(keyword)
-                        time.sleep(1)
                         search_input.send_keys(Keys.RETURN)
-                        time.sleep(4)
+                        self.wait_for_job_links(search_input)
                     
                     # Find job listings
                     job_selectors = [
-                        "//a[contains(@href, '/job/')]",
-                        "//div[contains(@class, 'job')]//a",
-                        "//h2//a | //h3//a",
-                        "//a[contains(@class, 'job-title')]"
+                        "a[href*='/job/']",
+                        "div[class*='job'] a",
+                        "h2 a, h3 a",
+                        "a[class*='job-title']"
                     ]
                     
-                    job_elements = []
-                    for selector in job_selectors:
-                        try:
-                            elements = self.driver.find_elements(By.XPATH, selector)
-                            if elements:
-                                job_elements = elements
-                                break
-                        except:
-                            continue
+                    job_elements = self.find_first_matching(job_selectors)
                     
                     self.logger.info(f"Found {len(job_elements)} potential job elements for '{keyword}'")
                     
+                    # Read the links in bulk; on a re-run they are often all known already
+                    job_links = self.driver.execute_script(self.LINK_FIELDS_JS, job_elements[:5]) if job_elements else []
+                    if job_links and all(self.is_duplicate_url(href) for href, *_ in job_links):
+                        self.logger.info(f"No new BrighterMonday jobs for '{keyword}', skipping")
+                        continue
+                    
                     # Process jobs
-                    for i, job_element in enumerate(job_elements[:5]):
+                    for i, (job_link, job_text, job_title_attr, _) in enumerate(job_links):
                         try:
-                            job_link = job_element.get_attribute('href')
-                            if not job_link or job_link in self.duplicate_urls:
+                            if not job_link or self.is_duplicate_url(job_link):
                                 continue
                             
-                            job_title = job_element.text.strip() or job_element.get_attribute('title')
+                            job_title = job_text or job_title_attr
                             
                             if not job_title or not self.is_relevant_job(job_title):
                                 continue
@@ -932,7 +1856,7 @@ class KenyaJobScraper:
                                 'source': 'BrighterMonday Kenya'
                             }
                             
-                            self.duplicate_urls.add(job_link)
+                            self.mark_url_seen(job_link)
                             self.save_job_data(job_data)
                             jobs.append(job_data)
                             
@@ -947,14 +1871,8 @@ class KenyaJobScraper:
         except Exception as e:
             self.logger.error(f"Error in BrighterMonday scraping: {str(e)}")
         
-        # Cache results with run configuration
-        self.cache[cache_key] = {
-            'jobs': jobs,
-            'run_config': self.current_run_config,
-            'date': self.today.isoformat(),
-            'timestamp': datetime.now().isoformat()
-        }
-        self.save_cache()
+        # Cache results with run configuration and the site's HTTP validators
+        self.update_site_cache(cache_key, jobs, "https://www.brightermonday.co.ke")
         
         self.logger.info(f"BrighterMonday scraping completed. Found {len(jobs)} relevant jobs")
         return jobs
@@ -967,7 +1885,7 @@ class KenyaJobScraper:
         try:
             # Check cache with run configuration tracking
             cache_key = self.get_cache_key_with_config("fuzu")
-            if self.is_cache_valid_for_run(cache_key):
+            if self.is_cache_valid_for_run(cache_key, "https://www.fuzu.com/kenya/job"):
                 cached_jobs = self.cache[cache_key].get('jobs', [])
                 self.logger.info(f"Using cached Fuzu data ({len(cached_jobs)} jobs)")
                 return cached_jobs
@@ -976,137 +1894,67 @@ class KenyaJobScraper:
             self.setup_driver()
             
             # Navigate directly to Fuzu Kenya jobs page
+            # Allow images while the human verification widget may be showing
+            self.set_image_blocking(False)
             self.logger.info("Navigating to Fuzu Kenya...")
             self.driver.get("https://www.fuzu.com/kenya/job")
-            time.sleep(5)
             
             # Handle human verification with enhanced method
-            if not self.handle_human_verification():
+            verified = self.handle_human_verification()
+            self.set_image_blocking(True)
+            if not verified:
                 self.logger.error("Failed to complete human verification for Fuzu")
                 return jobs
             
             # Handle additional popups after verification
             self.handle_popups()
-            time.sleep(3)
             
             # Use ALL keywords from configuration
             keywords_to_use = self.search_keywords
             
+            # Job listing selectors, most specific first
+            job_selectors = [
+                "a[href*='/job/']",
+                "div[class*='job'] a",
+                "h2 a, h3 a",
+                "a[class*='job-title']"
+            ]
+            
+            # Posting date inside a listing, read together with its link and title
+            date_selectors = [
+                ".//*[contains(text(), 'Posted') or contains(text(), 'Published')]",
+                "[class*='date']",
+                ".//*[contains(text(), 'ago') or contains(text(), 'days')]"
+            ]
+            
             # For each search keyword
             for keyword_idx, keyword in enumerate(keywords_to_use):
                 try:
                     self.logger.info(f"Searching Fuzu for keyword {keyword_idx+1}/{len(keywords_to_use)}: {keyword}")
+                    job_elements = job_listings = None
                     
                     # Multiple attempts to find search input
                     search_selectors = [
-                        "//input[@placeholder='Show jobs']",
-                        "//input[contains(@class, 'search')]",
-                        "//input[@type='text' and contains(@placeholder, 'job')]",
-                        "//form//input[@type='text']",
-                        "//input[@name='q']",
-                        "//input[@name='search']",
-                        "//div[contains(@class, 'search')]//input[@type='text']"
+                        "input[placeholder='Show jobs']",
+                        "input[class*='search']",
+                        "input[type='text'][placeholder*='job']",
+                        "form input[type='text']",
+                        "input[name='q']",
+                        "input[name='search']",
+                        "div[class*='search'] input[type='text']"
                     ]
                     
-                    search_input = None
-                    for selector in search_selectors:
-                        try:
-                            search_input = self.wait.until(
-                                EC.presence_of_element_located((By.XPATH, selector))
-                            )
-                            if search_input.is_displayed() and search_input.is_enabled():
-                                # Additional wait to ensure it's truly interactable
-                                self.wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
-                                break
-                        except:
-                            continue
+                    try:
+                        search_input = self.wait.until(lambda driver: self.find_first_visible(search_selectors))
+                    except TimeoutException:
+                        search_input = None
                     
                     if not search_input:
                         self.logger.warning("Could not find search input on Fuzu")
                         continue
                     
-                    # Clear and enter search term
-                    search_input.clear()
-                    search_input.send_keys(keyword)
-                    time.sleep(1)
-                    
-                    # Find and click search button
-                    
-                    search_button_selectors = [
-                        "//button[contains(@class, 'fz-btn') and contains(@class, 'b2c-button')]//div[contains(text(), 'Show jobs')]/..",
-                        "//button[contains(@class, 'fz-btn')]//div[contains(@class, 'fz-btn__text') and contains(text(), 'Show jobs')]/..",
-                        "//button[contains(@class, 'Button__StyledButton')]//div[contains(text(), 'Show jobs')]/..",
-                        "//button[.//div[contains(text(), 'Show jobs')]]",
-                        "//button[contains(@class, 'fz-btn')]",
-                        "//button[contains(text(), 'Show jobs')]",
-                        "//button[contains(@class, 'show-jobs')]",
-                        "//button[@type='submit']",
-                        "//input[@type='submit']"
-                    ]
-                    
-                    search_button = None
-                    for selector in search_button_selectors:
-                        try:
-                            search_button = self.driver.find_element(By.XPATH, selector)
-                            if search_button.is_displayed() and search_button.is_enabled():
-                                self.logger.info(f"Found search button using selector: {selector}")
-                                break
-                        except:
-                            continue
-                    
-                    if search_button:
-                        try:
-                            # Try regular click first
-                            search_button.click()
-                            self.logger.info("Successfully clicked search button")
-                            time.sleep(5)
-                        except Exception as e:
-                            # If regular click fails, try JavaScript click
-                            self.logger.info(f"Regular click failed ({e}), trying JavaScript click")
-                            self.driver.execute_script("arguments[0].click();", search_button)
-                            time.sleep(5)
-                    else:
-                        self.logger.warning("Could not find search button on Fuzu")
-                        continue
-                    #search_button_selectors = [
-                        #"//button[contains(text(), 'Show jobs')]",
-                        #"//button[contains(@class, 'show-jobs')]",
-                        #"//button[@type='submit']",
-                        #"//input[@type='submit']"
-                    #]
-                    
-                    #search_button = None
-                    #for selector in search_button_selectors:
-                        #try:
-                            #search_button = self.driver.find_element(By.XPATH, selector)
-                            #if search_button.is_displayed():
-                                #break
-                        #except:
-                            #continue
-                    
-                
-                    #if search_button:
-                        #self.driver.execute_script("arguments[0].click();", search_button)
-                        #time.sleep(5)
-                    #else:
-                        # Try pressing Enter
-                        #search_input.send_keys(Keys.RETURN)
-                        #time.sleep(5)
-                    
-                    # Find job listings with multiple selectors
-                    # Clear and enter search term with enhanced interaction
-                    search_input.clear()
-                    time.sleep(1)
-                    
-                    # Type the keyword character by character to simulate human typing
-                    for char in keyword:
-                        search_input.send_keys(char)
-                        time.sleep(0.1)
-                    
-                    # Trigger input events that JavaScript might be listening for
-                    self.driver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", search_input)
-                    self.driver.execute_script("arguments[0].dispatchEvent(new Event('change', { bubbles: true }));", search_input)
-                    time.sleep(1)
+                    # Enter search term and trigger the input events the page's JavaScript listens for
+                    self.driver.execute_script(self.SET_INPUT_VALUE_JS, search_input, keyword)
                     
                     # Log current URL before search
                     url_before = self.driver.current_url
@@ -1118,71 +1966,25 @@ class KenyaJobScraper:
                         "//button[contains(@class, 'fz-btn')]//div[contains(@class, 'fz-btn__text') and contains(text(), 'Show jobs')]/..",
                         "//button[contains(@class, 'Button__StyledButton')]//div[contains(text(), 'Show jobs')]/..",
                         "//button[.//div[contains(text(), 'Show jobs')]]",
-                        "//button[contains(@class, 'fz-btn')]",
+                        "button[class*='fz-btn']",
                         "//button[contains(text(), 'Show jobs')]",
-                        "//button[contains(@class, 'show-jobs')]",
-                        "//button[@type='submit']",
-                        "//input[@type='submit']"
+                        "button[class*='show-jobs']",
+                        "button[type='submit']",
+                        "input[type='submit']"
                     ]
                     
-                    search_button = None
-                    for selector in search_button_selectors:
-                        try:
-                            search_button = self.driver.find_element(By.XPATH, selector)
-                            if search_button.is_displayed() and search_button.is_enabled():
-                                self.logger.info(f"Found search button using selector: {selector}")
-                                break
-                        except:
-                            continue
+                    search_button = self.find_first_visible(search_button_selectors)
                     
                     if search_button:
                         try:
-                            # Scroll to the button to ensure it's in view
-                            self.driver.execute_script("arguments[0].scrollIntoView(true);", search_button)
-                            time.sleep(1)
-                            
-                            # Try multiple click methods
-                            click_success = False
-                            
-                            # Method 1: Regular click
-                            try:
-                                search_button.click()
-                                self.logger.info("Successfully clicked search button (regular click)")
-                                click_success = True
-                            except Exception as e:
-                                self.logger.info(f"Regular click failed: {e}")
-                            
-                            # Method 2: JavaScript click if regular click failed
-                            if not click_success:
-                                try:
-                                    self.driver.execute_script("arguments[0].click();", search_button)
-                                    self.logger.info("Successfully clicked search button (JavaScript click)")
-                                    click_success = True
-                                except Exception as e:
-                                    self.logger.info(f"JavaScript click failed: {e}")
-                            
-                            # Method 3: Submit form if button is in a form
-                            if not click_success:
-                                try:
-                                    form = search_button.find_element(By.XPATH, "./ancestor::form")
-                                    self.driver.execute_script("arguments[0].submit();", form)
-                                    self.logger.info("Successfully submitted form")
-                                    click_success = True
-                                except Exception as e:
-                                    self.logger.info(f"Form submit failed: {e}")
-                            
-                            # Method 4: Try pressing Enter on the search input
-                            if not click_success:
-                                try:
-                                    search_input.send_keys(Keys.RETURN)
-                                    self.logger.info("Successfully pressed Enter on search input")
-                                    click_success = True
-                                except Exception as e:
-                                    self.logger.info(f"Enter key failed: {e}")
+                            click_success = self._click_with_fallbacks(search_button, search_input)
                             
                             if click_success:
                                 # Wait for page to load/update
-                                time.sleep(3)
+                                try:
+                                    WebDriverWait(self.driver, 10).until(EC.url_changes(url_before))
+                                except TimeoutException:
+                                    pass  # Handled below as an in-place update
                                 
                                 # Check if URL changed or page updated
                                 url_after = self.driver.current_url
@@ -1196,43 +1998,35 @@ class KenyaJobScraper:
                                     # Wait for any loading indicators to disappear
                                     try:
                                         loading_selectors = [
-                                            "//div[contains(@class, 'loading')]",
-                                            "//div[contains(@class, 'spinner')]",
-                                            "//div[contains(@class, 'loader')]"
+                                            "div[class*='loading']",
+                                            "div[class*='spinner']",
+                                            "div[class*='loader']"
                                         ]
-                                        for loading_selector in loading_selectors:
-                                            try:
-                                                loading_element = self.driver.find_element(By.XPATH, loading_selector)
-                                                if loading_element.is_displayed():
-                                                    self.logger.info("Found loading indicator, waiting for it to disappear")
-                                                    WebDriverWait(self.driver, 10).until(
-                                                        EC.invisibility_of_element(loading_element)
-                                                    )
-                                                    break
-                                            except:
-                                                continue
-                                    except:
+                                        loading_element = self.find_first_visible(loading_selectors)
+                                        if loading_element:
+                                            self.logger.info("Found loading indicator, waiting for it to disappear")
+                                            WebDriverWait(self.driver, 10).until(
+                                                EC.invisibility_of_element(loading_element)
+                                            )
+                                    except WebDriverException:
                                         pass
                                 
-                                # Additional wait for results to load
-                                time.sleep(5)
+                                # Wait for results to load
+                                self.wait_for_job_links()
                                 
                                 # Try to detect if search results loaded
                                 try:
-                                    # Check for job results with the search keyword
-                                    job_elements = self.driver.find_elements(By.XPATH, "//a[contains(@href, '/job/')]")
+                                    # Check for job results with the search keyword (the listings
+                                    # read here are the ones saved below, so the page is only queried once)
+                                    job_elements = self.find_first_matching(job_selectors)
                                     self.logger.info(f"Found {len(job_elements)} total job elements after search")
                                     
+                                    # Link, title and posting date of the top listings in one round-trip
+                                    job_listings = self.driver.execute_script(self.LINK_FIELDS_JS, job_elements[:5], date_selectors) if job_elements else []
+                                    
                                     # Check if any job contains the search keyword
-                                    keyword_found = False
-                                    for job in job_elements[:5]:  # Check first 5 jobs
-                                        try:
-                                            job_text = job.text.lower()
-                                            if keyword.lower() in job_text:
-                                                keyword_found = True
-                                                break
-                                        except:
-                                            continue
+                                    keyword_folded = keyword.casefold()
+                                    keyword_found = any(keyword_folded in job_text.casefold() for _, job_text, _, _ in job_listings)
                                     
                                     if keyword_found:
                                         self.logger.info(f"Search appears successful - found jobs containing '{keyword}'")
@@ -1252,47 +2046,26 @@ class KenyaJobScraper:
                     else:
                         self.logger.warning("Could not find search button on Fuzu")
                         continue
-                    # Find job listings with multiple selectors
-                    job_selectors = [
-                        "//a[contains(@href, '/job/')]",
-                        "//div[contains(@class, 'job')]//a",
-                        "//h2//a | //h3//a",
-                        "//a[contains(@class, 'job-title')]"
-                    ]
-                    job_elements = []
-                    for selector in job_selectors:
-                        try:
-                            elements = self.driver.find_elements(By.XPATH, selector)
-                            if elements:
-                                job_elements = elements
-                                break
-                        except:
-                            continue
+                    # Find job listings with multiple selectors (unless the search check already did)
+                    if job_elements is None:
+                        job_elements = self.find_first_matching(job_selectors)
 
                     self.logger.info(f"Found {len(job_elements)} potential job elements for '{keyword}'")
 
-                    for job_element in job_elements[:5]:
+                    if job_listings is None:
+                        job_listings = self.driver.execute_script(self.LINK_FIELDS_JS, job_elements[:5], date_selectors) if job_elements else []
+
+                    for job_link, job_text, job_title_attr, job_date in job_listings:
                         try:
-                            # Extract posting date
-                            date_selectors = [
-                                ".//*[contains(text(), 'Posted') or contains(text(), 'Published')]",
-                                ".//*[contains(@class, 'date')]",
-                                ".//*[contains(text(), 'ago') or contains(text(), 'days')]"
-                            ]
-                            date_text = 'Not specified'
-                            for selector in date_selectors:
-                                try:
-                                    date_elem = job_element.find_element(By.XPATH, selector)
-                                    date_text_candidate = date_elem.text.strip()
-                                    if date_text_candidate and len(date_text_candidate) < 50:
-                                        date_text = date_text_candidate
-                                        break
-                                except Exception as e:
-                                    self.logger.debug(f"Error extracting additional details: {str(e)}")
-                                    continue
+                            if not job_link or self.is_duplicate_url(job_link):
+                                continue
+                            
+                            job_title = job_text or job_title_attr
+                            if not job_title or not self.is_relevant_job(job_title):
+                                continue
+                            
+                            date_text = job_date or 'Not specified'
 
-                            job_link = job_element.get_attribute('href')
-                            job_title = job_element.text.strip() or job_element.get_attribute('title')
                             job_data = {
                                 'job_title': job_title,
                                 'link': job_link,
@@ -1305,7 +2078,7 @@ class KenyaJobScraper:
                             }
 
                             if self.is_recent_job(job_data['date_posted']) and self.is_not_expired(job_data['date_expires']):
-                                self.duplicate_urls.add(job_data['link'])
+                                self.mark_url_seen(job_data['link'])
                                 self.save_job_data(job_data)
                                 jobs.append(job_data)
                         except Exception as e:
@@ -1319,14 +2092,8 @@ class KenyaJobScraper:
         except Exception as e:
             self.logger.error(f"Error in Fuzu scraping: {str(e)}")
         
-        # Cache results with run configuration
-        self.cache[cache_key] = {
-            'jobs': jobs,
-            'run_config': self.current_run_config,
-            'date': self.today.isoformat(),
-            'timestamp': datetime.now().isoformat()
-        }
-        self.save_cache()
+        # Cache results with run configuration and the site's HTTP validators
+        self.update_site_cache(cache_key, jobs, "https://www.fuzu.com/kenya/job")
         
         self.logger.info(f"Fuzu scraping completed. Found {len(jobs)} relevant jobs")
         return jobs
@@ -1339,78 +2106,46 @@ class KenyaJobScraper:
         try:
             # Check cache with run configuration tracking
             cache_key = self.get_cache_key_with_config("careerpointkenya")
-            if self.is_cache_valid_for_run(cache_key):
+            if self.is_cache_valid_for_run(cache_key, "https://www.careerpointkenya.co.ke"):
                 cached_jobs = self.cache[cache_key].get('jobs', [])
                 self.logger.info(f"Using cached CareerPoint data ({len(cached_jobs)} jobs)")
                 return cached_jobs
             
-            # Setup driver if not already done
-            self.setup_driver()
-            
-            # Navigate to CareerPoint Kenya
-            self.driver.get("https://www.careerpointkenya.co.ke")
-            time.sleep(4)
-            
-            # Handle popups
-            self.handle_popups()
-            
-            # Try to click Browse Latest Jobs
-            try:
-                browse_btn = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'Browse Latest Jobs') or contains(@href, 'jobs')]"))
-                )
-                self.driver.execute_script("arguments[0].click();", browse_btn)
-                time.sleep(3)
-            except:
-                try:
-                    latest_jobs = self.driver.find_element(By.XPATH, "//a[contains(text(), 'Latest Jobs')]")
-                    self.driver.execute_script("arguments[0].click();", latest_jobs)
-                    time.sleep(3)
-                except:
-                    pass
+            # The listing is static HTML; the browser is only needed if plain HTTP does not get it
+            job_listings = self.fetch_careerpoint_listings()
+            if job_listings is None:
+                job_listings = self.browse_careerpoint_listings()
             
             # Use ALL keywords from configuration
             keywords_to_use = self.search_keywords
             
+            # Every keyword filters this same listing page, read once above; is_relevant_job(title, keyword)
+            # splits into a title test and a keyword test, so each is matched once instead of per pair
+            relevant_titles = [listing for listing in job_listings if self.is_relevant_job(listing[1])]
             # For each search keyword, search in the current page content
             for keyword_idx, keyword in enumerate(keywords_to_use):
                 try:
                     self.logger.info(f"Searching CareerPoint for keyword {keyword_idx+1}/{len(keywords_to_use)}: {keyword}")
                     
-                    # Look for job listings on current page
-                    job_elements = self.driver.find_elements(By.XPATH, "//a[contains(@href, '/20') and contains(text(), 'Job')] | //a[contains(@href, '/job/')]")
-                    
-                    relevant_jobs = []
-                    for job_element in job_elements:
-                        job_title = job_element.text.strip()
-                        if self.is_relevant_job(job_title, keyword):
-                            relevant_jobs.append(job_element)
+                    relevant_jobs = job_listings if self.is_relevant_job(keyword) else relevant_titles
                     
                     self.logger.info(f"Found {len(relevant_jobs)} relevant job listings for '{keyword}'")
                     
-                    for job_element in relevant_jobs[:3]:  # Limit results per keyword
+                    for job_link, job_title, job_date in relevant_jobs[:3]:  # Limit results per keyword
                         try:
-                            job_title = job_element.text.strip()
-                            job_link = job_element.get_attribute('href')
-                            
-                            if job_link in self.duplicate_urls:
+                            if self.is_duplicate_url(job_link):
                                 continue
                             
-                            # Extract date from same container
-                            date_posted = 'Not specified'
-                            try:
-                                date_container = job_element.find_element(By.XPATH, ".//ancestor::article | .//ancestor::div")
-                                date_elem = date_container.find_element(By.XPATH, ".//time[@class='entry-date published']")
-                                date_posted = date_elem.text.strip()
-                            except:
-                                pass
+                            # Date from the listing's own card
+                            date_posted = job_date or 'Not specified'
                             
                             # Check if job is older than 7 days - if so, stop immediately
-                            if date_posted != 'Not specified' and not self.is_recent_job(date_posted):
+                            is_recent = self.is_recent_job(date_posted)
+                            if date_posted != 'Not specified' and not is_recent:
                                 self.logger.info(f"Job older than 7 days detected: {job_title}. Stopping CareerPoint scraping.")
                                 break
                             
-                            if self.is_recent_job(date_posted):
+                            if is_recent:
                                 job_data = {
                                     'job_title': job_title,
                                     'link': job_link,
@@ -1422,7 +2157,7 @@ class KenyaJobScraper:
                                     'source': 'CareerPoint Kenya'
                                 }
                                 
-                                self.duplicate_urls.add(job_link)
+                                self.mark_url_seen(job_link)
                                 self.save_job_data(job_data)
                                 jobs.append(job_data)
                             
@@ -1437,18 +2172,84 @@ class KenyaJobScraper:
         except Exception as e:
             self.logger.error(f"Error in CareerPoint scraping: {str(e)}")
         
-        # Cache results with run configuration
-        self.cache[cache_key] = {
-            'jobs': jobs,
-            'run_config': self.current_run_config,
-            'date': self.today.isoformat(),
-            'timestamp': datetime.now().isoformat()
-        }
-        self.save_cache()
+        # Cache results with run configuration and the site's HTTP validators
+        self.update_site_cache(cache_key, jobs, "https://www.careerpointkenya.co.ke")
         
         self.logger.info(f"CareerPoint scraping completed. Found {len(jobs)} relevant jobs")
         return jobs
 
+    def fetch_careerpoint_listings(self) -> Optional[List]:
+        """[link, title, date] for CareerPoint's latest jobs over plain HTTP (None if that does not work)"""
+        if lxml_html is None:
+            return None
+        
+        # The listing page saved by a recent run (links already absolute) saves both GETs
+        html = self.load_results_page("careerpointkenya", "latest", 1)
+        if html is not None:
+            self.logger.info("Using saved CareerPoint listing page")
+            tree = lxml_html.fromstring(html)
+        else:
+            home_url = "https://www.careerpointkenya.co.ke"
+            tree = self.fetch_job_page(home_url)
+            if tree is None:
+                return None
+            tree.make_links_absolute(home_url)
+            
+            # Follow Browse Latest Jobs, as the browser flow does
+            browse_links = tree.xpath("//a[contains(text(), 'Browse Latest Jobs') or contains(@href, 'jobs')]/@href") or tree.xpath("//a[contains(text(), 'Latest Jobs')]/@href")
+            if browse_links:
+                listing = self.fetch_job_page(browse_links[0])
+                if listing is not None:
+                    listing.make_links_absolute(browse_links[0])
+                    tree = listing
+        
+        job_listings = []
+        for link in tree.xpath(self.CAREERPOINT_LINKS_XPATH):
+            dates = link.xpath(self.CAREERPOINT_DATE_XPATH)
+            job_listings.append([link.get('href', ''), self._node_text(link), self._node_text(dates[0]) if dates else None])
+        if not job_listings:
+            self.logger.info("No CareerPoint listings in the static HTML, using browser")
+            return None
+        if html is None:
+            self.save_results_page("careerpointkenya", "latest", 1, lxml_html.tostring(tree, encoding='unicode'))
+        self.logger.info(f"Read {len(job_listings)} CareerPoint listings over HTTP")
+        return job_listings
+
+    def browse_careerpoint_listings(self) -> List:
+        """[link, title, date] for CareerPoint's latest jobs, read in the browser"""
+        # Setup driver if not already done
+        self.setup_driver(headless=True)
+        
+        # Navigate to CareerPoint Kenya
+        self.driver.get("https://www.careerpointkenya.co.ke")
+        self.wait_for_document_ready()
+        
+        # Handle popups
+        self.handle_popups()
+        
+        # Try to click Browse Latest Jobs
+        try:
+            browse_btn = self.wait.until(
+                EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'Browse Latest Jobs') or contains(@href, 'jobs')]"))
+            )
+            self.driver.execute_script("arguments[0].click();", browse_btn)
+            self.wait_ready("//body", browse_btn)
+            self.wait_for_document_ready()
+        except WebDriverException:
+            try:
+                latest_jobs = self.driver.find_element(By.XPATH, "//a[contains(text(), 'Latest Jobs')]")
+                self.driver.execute_script("arguments[0].click();", latest_jobs)
+                self.wait_ready("//body", latest_jobs)
+                self.wait_for_document_ready()
+            except WebDriverException:
+                pass
+        
+        job_elements = self.driver.find_elements(By.XPATH, self.CAREERPOINT_LINKS_XPATH)
+        if not job_elements:
+            return []
+        # Nearest enclosing card, so the date lookup stays inside this listing
+        return self.driver.execute_script(self.CARD_LINKS_JS, job_elements, "article, div", "time.entry-date.published")
+
     def scrape_myjobsinkenya(self) -> List[Dict]:
         """Scrape jobs from MyJobsInKenya with enhanced error handling"""
         jobs = []
@@ -1457,279 +2258,245 @@ class KenyaJobScraper:
         try:
             # Check cache with run configuration tracking
             cache_key = self.get_cache_key_with_config("myjobsinkenya")
-            if self.is_cache_valid_for_run(cache_key):
+            if self.is_cache_valid_for_run(cache_key, "https://www.myjobsinkenya.com/"):
                 cached_jobs = self.cache[cache_key].get('jobs', [])
                 self.logger.info(f"Using cached MyJobsInKenya data ({len(cached_jobs)} jobs)")
                 return cached_jobs
             
-            # Setup driver if not already done
-            self.setup_driver()
+            # Keyword searches are independent; run them side by side, one browser per thread
+            jobs.extend(self.run_keyword_searches(self._scrape_myjobsinkenya_keyword))
+                    
+        except Exception as e:
+            self.logger.error(f"Error in MyJobsInKenya scraping: {str(e)}")
+        
+        # Cache results with run configuration and the site's HTTP validators
+        self.update_site_cache(cache_key, jobs, "https://www.myjobsinkenya.com/")
+        
+        self.logger.info(f"MyJobsInKenya scraping completed. Found {len(jobs)} relevant jobs")
+        return jobs
+
+    def _scrape_myjobsinkenya_keyword(self, keyword_idx: int, keyword: str, keyword_count: int) -> List[Dict]:
+        """Search MyJobsInKenya for one keyword on this thread's driver"""
+        jobs = []
+        try:
+            self.logger.info(f"Searching MyJobsInKenya for keyword {keyword_idx+1}/{keyword_count}: {keyword}")
+            
+            # Each worker thread drives its own browser; later keywords search from wherever it is on the site
+            self.setup_driver(headless=True)
+            if "myjobsinkenya.com" not in self.driver.current_url:
+                self.driver.get("https://www.myjobsinkenya.com/")
+                self.wait_for_document_ready()
+                self.handle_popups()
+            
+            # Find main search input
+            search_selectors = [
+                "input[placeholder='Search job title, skill or company']",
+                "input[placeholder*='Search']",
+                "input[type='text'][class*='search']",
+                "input[name='search']"
+            ]
             
-            # Navigate to MyJobsInKenya
-            self.driver.get("https://www.myjobsinkenya.com/")
-            time.sleep(4)
+            search_input = self.find_first_visible(search_selectors)
             
-            # Handle popups
-            self.handle_popups()
+            if search_input:
+                # Submitting with Enter works on the search form, so no button lookup is needed
+                search_input.clear()
+                search_input.send_keys(keyword + Keys.RETURN)
+                
+                self.wait_for_job_links(search_input)
+            
+            # Find job listings
+            job_selectors = [
+                "a[href*='/jobs/'][href*='/view']",
+                "a[href*='/job/']",
+                "div[class*='job'] a",
+                "h2 a, h3 a"
+            ]
             
-            # Use ALL keywords from configuration
-            keywords_to_use = self.search_keywords
+            job_elements = self.find_first_matching(job_selectors)
             
-            # For each search keyword
-            for keyword_idx, keyword in enumerate(keywords_to_use):
+            self.logger.info(f"Found {len(job_elements)} job listings for '{keyword}'")
+            
+            # Link, title, location and deadline of the top listings in one round-trip
+            job_listings = self.driver.execute_script(self.MYJOBSINKENYA_CARD_JS, job_elements[:4]) if job_elements else []  # Limit results per keyword
+            
+            for job_link, job_title, location, deadline_text in job_listings:
                 try:
-                    self.logger.info(f"Searching MyJobsInKenya for keyword {keyword_idx+1}/{len(keywords_to_use)}: {keyword}")
-                    
-                    # Find main search input
-                    search_selectors = [
-                        "//input[@placeholder='Search job title, skill or company']",
-                        "//input[contains(@placeholder, 'Search')]",
-                        "//input[@type='text' and contains(@class, 'search')]",
-                        "//input[@name='search']"
-                    ]
-                    
-                    search_input = None
-                    for selector in search_selectors:
-                        try:
-                            search_input = self.driver.find_element(By.XPATH, selector)
-                            if search_input.is_displayed():
-                                break
-                        except:
-                            continue
-                    
-                    if search_input:
-                        search_input.clear()
-                        search_input.send_keys(keyword)
-                        time.sleep(1)
-                        
-                        # Try multiple search button selectors
-                        search_btn_selectors = [
-                            "//button[contains(text(), 'Search')]",
-                            "//input[@type='submit']",
-                            "//a[contains(text(), 'Search')]",
-                            "//button[contains(@class, 'search')]"
-                        ]
-                        
-                        button_clicked = False
-                        for btn_selector in search_btn_selectors:
-                            try:
-                                search_btn = self.driver.find_element(By.XPATH, btn_selector)
-                                self.driver.execute_script("arguments[0].click();", search_btn)
-                                button_clicked = True
-                                break
-                            except:
-                                continue
-                        
-                        if not button_clicked:
-                            search_input.send_keys(Keys.RETURN)
-                        
-                        time.sleep(4)
-                    
-                    # Find job listings
-                    job_selectors = [
-                        "//a[contains(@href, '/jobs/') and contains(@href, '/view')]",
-                        "//a[contains(@href, '/job/')]",
-                        "//div[contains(@class, 'job')]//a",
-                        "//h2//a | //h3//a"
-                    ]
+                    if not self.is_relevant_job(job_title) or self.is_duplicate_url(job_link):
+                        continue
                     
-                    job_elements = []
-                    for selector in job_selectors:
-                        try:
-                            elements = self.driver.find_elements(By.XPATH, selector)
-                            if elements:
-                                job_elements = elements
-                                break
-                        except:
-                            continue
+                    # Create basic job data
+                    job_data = {
+                        'job_title': job_title,
+                        'link': job_link,
+                        'date_posted': 'Recently posted',
+                        'date_expires': 'Not specified',
+                        'qualification': 'Not specified',
+                        'years_of_experience': 'Not specified',
+                        'location': 'Kenya',
+                        'source': 'MyJobsInKenya'
+                    }
                     
-                    self.logger.info(f"Found {len(job_elements)} job listings for '{keyword}'")
+                    # Additional details from the listing card, if it had them
+                    if location is not None:
+                        job_data['location'] = location
+                    if deadline_text and 'Deadline' in deadline_text:
+                        job_data['date_expires'] = deadline_text.split('Deadline')[1].replace(':', '').strip()
                     
-                    for job_element in job_elements[:4]:  # Limit results per keyword
-                        try:
-                            job_title = job_element.text.strip()
-                            job_link = job_element.get_attribute('href')
-                            
-                            if not self.is_relevant_job(job_title) or job_link in self.duplicate_urls:
-                                continue
-                            
-                            # Create basic job data
-                            job_data = {
-                                'job_title': job_title,
-                                'link': job_link,
-                                'date_posted': 'Recently posted',
-                                'date_expires': 'Not specified',
-                                'qualification': 'Not specified',
-                                'years_of_experience': 'Not specified',
-                                'location': 'Kenya',
-                                'source': 'MyJobsInKenya'
-                            }
-                            
-                            # Try to extract additional details if possible
-                            try:
-                                job_container = job_element.find_element(By.XPATH, ".//ancestor::div[contains(@class, 'job') or contains(@class, 'listing') or contains(@class, 'card')]")
-                                
-                                # Extract location
-                                try:
-                                    location_elem = job_container.find_element(By.XPATH, ".//i[@class='fa fa-map-marker']//parent::*")
-                                    job_data['location'] = location_elem.text.strip()
-                                except:
-                                    pass
-                                
-                                # Extract deadline
-                                try:
-                                    deadline_elem = job_container.find_element(By.XPATH, ".//*[contains(text(), 'Deadline')]")
-                                    deadline_text = deadline_elem.text
-                                    if 'Deadline' in deadline_text:
-                                        job_data['date_expires'] = deadline_text.split('Deadline')[1].replace(':', '').strip()
-                                except:
-                                    pass
-                            except:
-                                pass
-                            
-                            self.duplicate_urls.add(job_link)
-                            self.save_job_data(job_data)
-                            jobs.append(job_data)
-                            
-                        except Exception as e:
-                            self.logger.error(f"Error processing MyJobsInKenya job: {str(e)}")
-                            continue
+                    if self.claim_url(job_link):
+                        self.save_job_data(job_data)
+                        jobs.append(job_data)
                     
                 except Exception as e:
-                    self.logger.error(f"Error searching MyJobsInKenya for '{keyword}': {str(e)}")
+                    self.logger.error(f"Error processing MyJobsInKenya job: {str(e)}")
                     continue
-                    
+            
         except Exception as e:
-            self.logger.error(f"Error in MyJobsInKenya scraping: {str(e)}")
-        
-        # Cache results with run configuration
-        self.cache[cache_key] = {
-            'jobs': jobs,
-            'run_config': self.current_run_config,
-            'date': self.today.isoformat(),
-            'timestamp': datetime.now().isoformat()
-        }
-        self.save_cache()
+            self.logger.error(f"Error searching MyJobsInKenya for '{keyword}': {str(e)}")
         
-        self.logger.info(f"MyJobsInKenya scraping completed. Found {len(jobs)} relevant jobs")
         return jobs
 
-    def generate_dashboard(self):
-        """Generate an interactive HTML dashboard for scraped jobs"""
-        try:
-            # Load job data if not already loaded
-            if not self.jobs_data:
-                if os.path.exists(self.json_filename):
-                    with open(self.json_filename, 'r', encoding='utf-8') as f:
-                        self.jobs_data = json.load(f)
-            
-            if not self.jobs_data:
-                self.logger.warning("No job data available for dashboard")
-                return False
-            
-            # Prepare data for dashboard
-            df = pd.DataFrame(self.jobs_data)
-            
-            # Generate statistics
-            total_jobs = len(df)
-            sources = df['source'].value_counts().to_dict()
-            recent_jobs = len(df[df['date_posted'] != 'Not specified'])
-            top_locations = df['location'].value_counts().head(5).to_dict()
-            
-            # Create job table rows
-            job_rows = []
-            for job in self.jobs_data:
-                color_index = hash(job.get('source', '')) % 5
-                colors = ["#FF6B6B", "#4ECDC4", "#45B7D1", "#96CEB4", "#FECA57"]
-                row = f"""
-                    <tr>
-                        <td><strong>{job.get('job_title', 'N/A')}</strong></td>
-                        <td><span class="source-badge" style="background: {colors[color_index]}">{job.get('source', 'N/A')}</span></td>
-                        <td>{job.get('location', 'N/A')}</td>
-                        <td>{job.get('date_posted', 'N/A')}</td>
-                        <td>{job.get('date_expires', 'N/A')}</td>
-                        <td>{job.get('qualification', 'N/A')}</td>
-                        <td>{job.get('years_of_experience', 'N/A')}</td>
-                        <td><a href="{job.get('link', '#')}" target="_blank" class="job-link">Apply</a></td>
-                    </tr>"""
-                job_rows.append(row)
-            
-            # Create dashboard HTML
-            html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Kenya Jobs Dashboard - {self.today}</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ 
+    def jobs_frame(self, jobs: List[Dict]):
+        """DataFrame of jobs built column by column over JOB_FIELDS (missing fields are None).
+
+        pandas is imported here, not at module load, since nothing on the
+        scraping path needs it."""
+        import pandas as pd
+        return pd.DataFrame({field: [job.get(field) for job in jobs] for field in self.JOB_FIELDS}, columns=self.JOB_FIELDS)
+
+    # Static dashboard stylesheet (kept out of the f-string so it is neither rebuilt nor brace-escaped)
+    DASHBOARD_CSS = """
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { 
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh; padding: 20px; color: #333;
-        }}
-        .container {{ 
+        }
+        .container { 
             max-width: 1200px; margin: 0 auto; 
             background: white; border-radius: 15px; 
             box-shadow: 0 20px 40px rgba(0,0,0,0.1); overflow: hidden;
-        }}
-        .header {{ 
+        }
+        .header { 
             background: linear-gradient(45deg, #FF6B6B, #4ECDC4); 
             color: white; padding: 30px; text-align: center;
-        }}
-        .header h1 {{ font-size: 2.5em; margin-bottom: 10px; }}
-        .header p {{ font-size: 1.1em; opacity: 0.9; }}
-        .stats-grid {{ 
+        }
+        .header h1 { font-size: 2.5em; margin-bottom: 10px; }
+        .header p { font-size: 1.1em; opacity: 0.9; }
+        .stats-grid { 
             display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); 
             gap: 20px; padding: 30px; background: #f8f9fa;
-        }}
-        .stat-card {{ 
+        }
+        .stat-card { 
             background: white; padding: 25px; border-radius: 10px; 
             box-shadow: 0 5px 15px rgba(0,0,0,0.08); text-align: center;
             transition: transform 0.3s ease;
-        }}
-        .stat-card:hover {{ transform: translateY(-5px); }}
-        .stat-number {{ font-size: 2.5em; font-weight: bold; color: #667eea; }}
-        .stat-label {{ font-size: 1.1em; color: #666; margin-top: 10px; }}
-        .charts-section {{ padding: 30px; }}
-        .chart-container {{ 
+        }
+        .stat-card:hover { transform: translateY(-5px); }
+        .stat-number { font-size: 2.5em; font-weight: bold; color: #667eea; }
+        .stat-label { font-size: 1.1em; color: #666; margin-top: 10px; }
+        .charts-section { padding: 30px; }
+        .chart-container { 
             background: white; margin: 20px 0; padding: 20px; 
             border-radius: 10px; box-shadow: 0 5px 15px rgba(0,0,0,0.05);
-        }}
-        .jobs-table {{ 
+        }
+        .jobs-table { 
             width: 100%; border-collapse: collapse; margin-top: 20px;
             background: white; border-radius: 10px; overflow: hidden;
-        }}
-        .jobs-table th {{ 
+        }
+        .jobs-table th { 
             background: #667eea; color: white; padding: 15px; 
             text-align: left; font-weight: 600;
-        }}
-        .jobs-table td {{ padding: 12px 15px; border-bottom: 1px solid #eee; }}
-        .jobs-table tr:hover {{ background: #f8f9fa; }}
-        .job-link {{ color: #667eea; text-decoration: none; font-weight: 500; }}
-        .job-link:hover {{ text-decoration: underline; }}
-        .source-badge {{ 
+        }
+        .jobs-table td { padding: 12px 15px; border-bottom: 1px solid #eee; }
+        .jobs-table tr:hover { background: #f8f9fa; }
+        .job-link { color: #667eea; text-decoration: none; font-weight: 500; }
+        .job-link:hover { text-decoration: underline; }
+        .source-badge { 
             padding: 4px 8px; border-radius: 15px; font-size: 0.8em; 
             color: white; font-weight: 500;
-        }}
-        .filter-section {{ 
+        }
+        .filter-section { 
             padding: 20px 30px; background: #f8f9fa; 
             border-bottom: 1px solid #eee;
-        }}
-        .filter-controls {{ 
+        }
+        .filter-controls { 
             display: flex; gap: 15px; flex-wrap: wrap; align-items: center;
-        }}
-        .filter-controls select, .filter-controls input {{ 
+        }
+        .filter-controls select, .filter-controls input { 
             padding: 8px 12px; border: 1px solid #ddd; 
             border-radius: 5px; font-size: 1em;
-        }}
-        .export-btn {{ 
+        }
+        .export-btn { 
             background: #4ECDC4; color: white; padding: 10px 20px; 
             border: none; border-radius: 5px; cursor: pointer; 
             font-size: 1em; font-weight: 500;
-        }}
-        .export-btn:hover {{ background: #45B7B8; }}
+        }
+        .export-btn:hover { background: #45B7B8; }
+        .jobs-table tr.hidden { display: none; }"""
+
+    def generate_dashboard(self):
+        """Generate an interactive HTML dashboard for scraped jobs"""
+        try:
+            # Load job data if not already loaded
+            if not self.jobs_data:
+                if os.path.exists(self.json_filename):
+                    with open(self.json_filename, 'r', encoding='utf-8') as f:
+                        self.jobs_data = json.load(f)
+            
+            if not self.jobs_data:
+                self.logger.warning("No job data available for dashboard")
+                return False
+            
+            # Prepare data for dashboard
+            df = self.jobs_frame(self.jobs_data)
+            
+            # Generate statistics
+            total_jobs = len(df)
+            sources = df['source'].value_counts().to_dict()
+            recent_jobs = len(df[df['date_posted'] != 'Not specified'])
+            top_locations = df['location'].value_counts().head(5).to_dict()
+            
+            # Create job table rows column-wise (one string concatenation per column, not per job);
+            # the rows are written out one by one rather than joined into the page
+            colors = ["#FF6B6B", "#4ECDC4", "#45B7D1", "#96CEB4", "#FECA57"]
+            columns = ['job_title', 'source', 'location', 'date_posted', 'date_expires', 'qualification', 'years_of_experience']
+            # Scraped text is escaped once per column before it goes into the markup
+            table = df[columns].fillna('N/A').astype(str).apply(lambda column: column.map(html.escape))
+            links = df['link'].fillna('#').astype(str).map(html.escape)
+            # Badge colour per source, in order of first appearance (stable across runs, unlike hash())
+            badge_colors = table['source'].map({source: colors[i % len(colors)] for i, source in enumerate(table['source'].unique())})
+            # filterTable matches on these data- attributes (title lowercased up front), not on cell text
+            job_rows = (
+                '\n                    <tr data-source="' + table['source'] + '" data-location="' + table['location'] + '" data-search="' + table['job_title'].str.lower() + '">'
+                '\n                        <td><strong>' + table['job_title'] + '</strong></td>'
+                '\n                        <td><span class="source-badge" style="background: ' + badge_colors + '">' + table['source'] + '</span></td>'
+                '\n                        <td>' + table['location'] + '</td>'
+                '\n                        <td>' + table['date_posted'] + '</td>'
+                '\n                        <td>' + table['date_expires'] + '</td>'
+                '\n                        <td>' + table['qualification'] + '</td>'
+                '\n                        <td>' + table['years_of_experience'] + '</td>'
+                '\n                        <td><a href="' + links + '" target="_blank" class="job-link">Apply</a></td>'
+                '\n                    </tr>'
+            )
+            
+            # Filter options and chart data, escaped for HTML and for the inline script respectively
+            source_options = "\n".join(f'<option value="{source}">{source}</option>' for source in map(html.escape, sources))
+            location_options = "\n".join(f'<option value="{loc}">{loc}</option>' for loc in map(html.escape, df['location'].dropna().astype(str).unique()) if loc != 'Not specified')
+            chart_data = json.dumps({
+                'sources': {'labels': list(sources), 'data': list(sources.values())},
+                'locations': {'labels': list(top_locations), 'data': list(top_locations.values())}
+            }).replace('</', '<\\/')
+            
+            # Create dashboard HTML; the rows are streamed between the two halves of the page
+            html_head = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Kenya Jobs Dashboard - {self.today}</title>
+    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+    <style>{self.DASHBOARD_CSS}
     </style>
 </head>
 <body>
@@ -1763,17 +2530,17 @@ class KenyaJobScraper:
                 <label>Filter by Source:</label>
                 <select id="sourceFilter" onchange="filterTable()">
                     <option value="">All Sources</option>
-                    {chr(10).join([f'<option value="{source}">{source}</option>' for source in sources.keys()])}
+                    {source_options}
                 </select>
                 
                 <label>Filter by Location:</label>
                 <select id="locationFilter" onchange="filterTable()">
                     <option value="">All Locations</option>
-                    {chr(10).join([f'<option value="{loc}">{loc}</option>' for loc in df['location'].unique() if loc != 'Not specified'])}
+                    {location_options}
                 </select>
                 
                 <label>Search Jobs:</label>
-                <input type="text" id="jobSearch" placeholder="Search job titles..." onkeyup="filterTable()">
+                <input type="text" id="jobSearch" placeholder="Search job titles...">
                 
                 <button class="export-btn" onclick="exportToCSV()">Export CSV</button>
             </div>
@@ -1807,7 +2574,8 @@ class KenyaJobScraper:
                     </tr>
                 </thead>
                 <tbody id="jobsTableBody">
-                    {''.join(job_rows)}
+                    """
+            html_tail = f"""
                 </tbody>
             </table>
         </div>
@@ -1815,10 +2583,11 @@ class KenyaJobScraper:
 
     <script>
         // Charts Data
-        const sourceData = {json.dumps(list(sources.keys()))};
-        const sourceCounts = {json.dumps(list(sources.values()))};
-        const locationData = {json.dumps(list(top_locations.keys()))};
-        const locationCounts = {json.dumps(list(top_locations.values()))};
+        const chartData = {chart_data};
+        const sourceData = chartData.sources.labels;
+        const sourceCounts = chartData.sources.data;
+        const locationData = chartData.locations.labels;
+        const locationCounts = chartData.locations.data;
         
         // Source Chart
         new Chart(document.getElementById('sourceChart'), {{
@@ -1860,36 +2629,46 @@ class KenyaJobScraper:
             }}
         }});
         
-        // Table Filtering
+        // Table Filtering (rows are looked up once; each row carries its lowercased title in data-search)
+        const jobRows = document.querySelectorAll('#jobsTableBody tr');
         function filterTable() {{
             const sourceFilter = document.getElementById('sourceFilter').value;
             const locationFilter = document.getElementById('locationFilter').value;
-            const searchTerm = document.getElementById('jobSearch').value.toLowerCase();
-            const rows = document.querySelectorAll('#jobsTableBody tr');
-            
-            rows.forEach(row => {{
-                const source = row.cells[1].textContent;
-                const location = row.cells[2].textContent;
-                const title = row.cells[0].textContent.toLowerCase();
+            // One-letter queries match nearly every title, so they are treated as no search at all
+            const query = document.getElementById('jobSearch').value.toLowerCase();
+            const searchTerm = query.length >= 2 ? query : '';
+            
+            // Rows are shown/hidden by class, all in one frame
+            requestAnimationFrame(() => jobRows.forEach(row => {{
+                // Cheapest test first; later ones only run for rows that are still in
+                const data = row.dataset;
+                const matches = (!sourceFilter || data.source === sourceFilter)
+                    && (!locationFilter || data.location.includes(locationFilter))
+                    && (!searchTerm || data.search.includes(searchTerm));
                 
-                const matchesSource = !sourceFilter || source.includes(sourceFilter);
-                const matchesLocation = !locationFilter || location.includes(locationFilter);
-                const matchesSearch = !searchTerm || title.includes(searchTerm);
-                
-                row.style.display = matchesSource && matchesLocation && matchesSearch ? '' : 'none';
-            }});
+                row.classList.toggle('hidden', !matches);
+            }}));
         }}
         
-        // Export to CSV
+        // Re-filter once typing pauses rather than on every keystroke
+        let searchTimer;
+        document.getElementById('jobSearch').addEventListener('input', () => {{
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(filterTable, 150);
+        }});
+        
+        // Export to CSV (one chunk per row; the Blob joins them without building one big string)
         function exportToCSV() {{
-            const rows = Array.from(document.querySelectorAll('#jobsTable tr'));
-            const csv = rows.map(row => 
-                Array.from(row.querySelectorAll('th, td'))
-                    .map(cell => '"' + cell.textContent.replace(/"/g, '""') + '"')
-                    .join(',')
-            ).join('\\n');
-            
-            const blob = new Blob([csv], {{ type: 'text/csv' }});
+            const chunks = [];
+            document.querySelectorAll('#jobsTable tr').forEach((row, index) => {{
+                let line = index ? '\\n' : '';
+                row.querySelectorAll('th, td').forEach((cell, i) => {{
+                    line += (i ? ',"' : '"') + cell.textContent.replace(/"/g, '""') + '"';
+                }});
+                chunks.push(line);
+            }});
+            
+            const blob = new Blob(chunks, {{ type: 'text/csv' }});
             const url = window.URL.createObjectURL(blob);
             const a = document.createElement('a');
             a.setAttribute('hidden', '');
@@ -1903,8 +2682,10 @@ class KenyaJobScraper:
 </body>
 </html>"""
             
-            with open(self.dashboard_filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            with open(self.dashboard_filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(html_head)
+                f.writelines(job_rows)
+                f.write(html_tail)
             
             self.logger.info(f"Interactive dashboard generated: {self.dashboard_filename}")
             return True
@@ -1913,6 +2694,74 @@ class KenyaJobScraper:
             self.logger.error(f"Error generating dashboard: {str(e)}")
             return False
 
+    def scrape_sites(self) -> Dict[str, int]:
+        """Scrape every site, up to site_workers at once in separate processes; returns job counts per site"""
+        scraping_results = {label: 0 for label, _, _ in self.SITES}
+        
+        if self.site_workers <= 1:
+            for label, _, method_name in self.SITES:
+                self.scrape_site_here(label, method_name, scraping_results)
+            return scraping_results
+        
+        # Selenium is not thread-safe, so each site gets a process (and Chrome) of its own;
+        # spawn keeps children from inheriting the parent's open files and logging thread
+        print(f"🔍 Scraping {len(self.SITES)} sites, {self.site_workers} at a time...")
+        run_here = []  # Sites the pool could not run (e.g. the worker cannot be pickled from Jupyter)
+        settled = set()  # Sites the pool finished with, successfully or not
+        try:
+            with ProcessPoolExecutor(max_workers=self.site_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                futures = {
+                    executor.submit(_scrape_site_worker, self.save_path, site_name, method_name, self.use_page_cache): (label, site_name, method_name)
+                    for label, site_name, method_name in self.SITES
+                }
+                for future in as_completed(futures):
+                    label, site_name, method_name = futures[future]
+                    settled.add(label)
+                    try:
+                        site_jobs, cache_entry = future.result()
+                    except (BrokenProcessPool, pickle.PicklingError, AttributeError) as e:
+                        self.logger.warning(f"{label} could not run in a worker process ({str(e)}), scraping it here")
+                        run_here.append((label, method_name))
+                        continue
+                    except Exception as e:
+                        self.logger.error(f"{label} failed: {str(e)}")
+                        print(f"❌ {label}: Failed")
+                        continue
+                    self.merge_site_results(site_name, site_jobs, cache_entry)
+                    scraping_results[label] = len(site_jobs)
+                    print(f"✅ {label}: {len(site_jobs)} jobs")
+        except (BrokenProcessPool, pickle.PicklingError, OSError) as e:
+            # The pool itself did not start (or broke); whatever has not finished runs here
+            self.logger.warning(f"Site worker processes unavailable ({str(e)}), scraping sequentially")
+            run_here += [(label, method_name) for label, _, method_name in self.SITES if label not in settled]
+        
+        for label, method_name in run_here:
+            self.scrape_site_here(label, method_name, scraping_results)
+        return scraping_results
+
+    def scrape_site_here(self, label: str, method_name: str, scraping_results: Dict[str, int]):
+        """Scrape one site in this process, recording its job count in scraping_results"""
+        try:
+            print(f"🔍 Scraping {label}...")
+            site_jobs = getattr(self, method_name)()
+            scraping_results[label] = len(site_jobs)
+            print(f"✅ {label}: {len(site_jobs)} jobs")
+        except Exception as e:
+            self.logger.error(f"{label} failed: {str(e)}")
+            print(f"❌ {label}: Failed")
+
+    def merge_site_results(self, site_name: str, site_jobs: List[Dict], cache_entry: Optional[Dict]):
+        """Save a worker's jobs (skipping ones another site already produced) and adopt its cache entry"""
+        is_duplicate_url, mark_url_seen, save_job_data = self.is_duplicate_url, self.mark_url_seen, self.save_job_data
+        for job in site_jobs:
+            if is_duplicate_url(job.get('link')):
+                continue
+            mark_url_seen(job.get('link'))
+            save_job_data(job)
+        if cache_entry:
+            self.cache[self.get_cache_key_with_config(site_name)] = cache_entry
+            self.save_cache()
+
     def run(self):
         """Main method to run the scraper with comprehensive reporting"""
         self.logger.info("=== Kenya Job Scraper v19 Started ===")
@@ -1930,62 +2779,10 @@ class KenyaJobScraper:
             print("-" * 60)
             
             # Scrape websites with error handling
-            scraping_results = {}
-            
-            # MyJobMag (primary focus - most reliable)
-            try:
-                print("🔍 Scraping MyJobMag...")
-                myjobmag_jobs = self.scrape_myjobmag()
-                scraping_results['MyJobMag'] = len(myjobmag_jobs)
-                print(f"✅ MyJobMag: {len(myjobmag_jobs)} jobs")
-            except Exception as e:
-                self.logger.error(f"MyJobMag failed: {str(e)}")
-                scraping_results['MyJobMag'] = 0
-                print(f"❌ MyJobMag: Failed")
-            
-            # BrighterMonday
-            try:
-                print("🔍 Scraping BrighterMonday...")
-                brightermonday_jobs = self.scrape_brightermonday()
-                scraping_results['BrighterMonday'] = len(brightermonday_jobs)
-                print(f"✅ BrighterMonday: {len(brightermonday_jobs)} jobs")
-            except Exception as e:
-                self.logger.error(f"BrighterMonday failed: {str(e)}")
-                scraping_results['BrighterMonday'] = 0
-                print(f"❌ BrighterMonday: Failed")
-            
-            # Fuzu (enhanced with better human verification)
-            try:
-                print("🔍 Scraping Fuzu...")
-                fuzu_jobs = self.scrape_fuzu()
-                scraping_results['Fuzu'] = len(fuzu_jobs)
-                print(f"✅ Fuzu: {len(fuzu_jobs)} jobs")
-            except Exception as e:
-                self.logger.error(f"Fuzu failed: {str(e)}")
-                scraping_results['Fuzu'] = 0
-                print(f"❌ Fuzu: Failed")
-            
-            # CareerPoint Kenya
-            try:
-                print("🔍 Scraping CareerPoint Kenya...")
-                careerpointkenya_jobs = self.scrape_careerpointkenya()
-                scraping_results['CareerPoint Kenya'] = len(careerpointkenya_jobs)
-                print(f"✅ CareerPoint Kenya: {len(careerpointkenya_jobs)} jobs")
-            except Exception as e:
-                self.logger.error(f"CareerPoint Kenya failed: {str(e)}")
-                scraping_results['CareerPoint Kenya'] = 0
-                print(f"❌ CareerPoint Kenya: Failed")
+            scraping_results = self.scrape_sites()
             
-            # MyJobsInKenya
-            try:
-                print("🔍 Scraping MyJobsInKenya...")
-                myjobsinkenya_jobs = self.scrape_myjobsinkenya()
-                scraping_results['MyJobsInKenya'] = len(myjobsinkenya_jobs)
-                print(f"✅ MyJobsInKenya: {len(myjobsinkenya_jobs)} jobs")
-            except Exception as e:
-                self.logger.error(f"MyJobsInKenya failed: {str(e)}")
-                scraping_results['MyJobsInKenya'] = 0
-                print(f"❌ MyJobsInKenya: Failed")
+            # Write the final JSON array before building the dashboard
+            self.flush_job_data()
             
             # Generate dashboard
             dashboard_created = False
@@ -2004,119 +2801,141 @@ class KenyaJobScraper:
             new_jobs_count = len(self.jobs_data) - initial_job_count
             total_time = datetime.now() - start_time
             
-            # Display comprehensive results
-            print("\n" + "="*80)
-            print("📋 ENHANCED SCRAPING RESULTS")
-            print("="*80)
-            print(f"📊 Jobs in database: {len(self.jobs_data)}")
-            print(f"🆕 New jobs added: {new_jobs_count}")
-            print(f"⏱️  Time taken: {total_time}")
-            print(f"🎯 Success rate: {(sum(1 for count in scraping_results.values() if count > 0)/len(scraping_results)*100):.1f}%")
-            print(f"🔧 Cache strategy: Run-based (no time limits)")
-            
-            print(f"\n📈 RESULTS BY SOURCE:")
-            for source, count in scraping_results.items():
-                status = "✅" if count > 0 else "❌"
-                print(f"   {status} {source:<20}: {count:>3} jobs")
-            
-            print(f"\n📁 FILES GENERATED:")
-            print(f"   📄 JSON: {os.path.basename(self.json_filename)}")
-            print(f"   📊 CSV:  {os.path.basename(self.csv_filename)}")
-            if dashboard_created:
-                print(f"   🎨 Dashboard: {os.path.basename(self.dashboard_filename)}")
-            
-            print(f"\n🔍 SEARCH KEYWORDS USED:")
-            for i, keyword in enumerate(self.search_keywords, 1):
-                print(f"   {i:2d}. {keyword}")
-            
-            print(f"\n💡 ENHANCED FEATURES:")
-            print(f"   🤖 Advanced human verification handling")
-            print(f"   📋 Smart caching based on run configuration")
-            print(f"   🔄 Better error recovery and retry logic")
-            print(f"   🎯 Enhanced popup handling across all sites")
-            print(f"   📊 Real-time progress tracking")
-            
-            if new_jobs_count > 0:
-                print(f"\n🎉 NEW JOBS FOUND:")
-                recent_jobs = self.jobs_data[-new_jobs_count:]
-                for i, job in enumerate(recent_jobs[:5], 1):  # Show max 5
-                    print(f"   {i}. {job.get('job_title', 'N/A')}")
-                    print(f"      🏢 {job.get('source', 'N/A')}")
-                    if job.get('date_posted') != 'Not specified':
-                        print(f"      📅 Posted: {job.get('date_posted')}")
-                    if job.get('location') != 'Not specified':
-                        print(f"      📍 {job.get('location')}")
-                    print()
+            # The summary is collected and reaches the console in a single write, not ~50 prints
+            json_name, csv_name, dashboard_name = (os.path.basename(name) for name in (self.json_filename, self.csv_filename, self.dashboard_filename))
+            summary = io.StringIO()
+            try:
+                with redirect_stdout(summary):
+                    # Display comprehensive results
+                    print("\n" + "="*80)
+                    print("📋 ENHANCED SCRAPING RESULTS")
+                    print("="*80)
+                    print(f"📊 Jobs in database: {len(self.jobs_data)}")
+                    print(f"🆕 New jobs added: {new_jobs_count}")
+                    print(f"⏱️  Time taken: {total_time}")
+                    print(f"🎯 Success rate: {(sum(1 for count in scraping_results.values() if count > 0)/len(scraping_results)*100):.1f}%")
+                    print(f"🔧 Cache strategy: Run-based (no time limits)")
+            
+                    # Each list block below goes out in a single print rather than one per line
+                    print(f"\n📈 RESULTS BY SOURCE:")
+                    print("\n".join(f"   {'✅' if count > 0 else '❌'} {source:<20}: {count:>3} jobs" for source, count in scraping_results.items()))
+            
+                    print(f"\n📁 FILES GENERATED:")
+                    print(f"   📄 JSON: {json_name}")
+                    print(f"   📊 CSV:  {csv_name}")
+                    if dashboard_created:
+                        print(f"   🎨 Dashboard: {dashboard_name}")
+            
+                    print(f"\n🔍 SEARCH KEYWORDS USED:")
+                    print("\n".join(f"   {i:2d}. {keyword}" for i, keyword in enumerate(self.search_keywords, 1)))
+            
+                    print(f"\n💡 ENHANCED FEATURES:")
+                    print(f"   🤖 Advanced human verification handling")
+                    print(f"   📋 Smart caching based on run configuration")
+                    print(f"   🔄 Better error recovery and retry logic")
+                    print(f"   🎯 Enhanced popup handling across all sites")
+                    print(f"   📊 Real-time progress tracking")
+            
+                    if new_jobs_count > 0:
+                        print(f"\n🎉 NEW JOBS FOUND:")
+                        recent_jobs = self.jobs_data[-new_jobs_count:]
+                        lines = []
+                        for i, job in enumerate(recent_jobs[:5], 1):  # Show max 5
+                            lines.append(f"   {i}. {job.get('job_title', 'N/A')}")
+                            lines.append(f"      🏢 {job.get('source', 'N/A')}")
+                            if job.get('date_posted') != 'Not specified':
+                                lines.append(f"      📅 Posted: {job.get('date_posted')}")
+                            if job.get('location') != 'Not specified':
+                                lines.append(f"      📍 {job.get('location')}")
+                            lines.append("")
+                        print("\n".join(lines))
                 
-                if new_jobs_count > 5:
-                    print(f"   ... and {new_jobs_count - 5} more jobs")
-            else:
-                print(f"\n💡 NO NEW JOBS FOUND")
-                print("   Possible reasons:")
-                print("   • All recent jobs already in database")
-                print("   • No jobs matching criteria in last 14 days")
-                print("   • Keywords may need adjustment")
-                print("   • Cache may be serving previous results")
-            
-            # Display file locations for easy access
-            print(f"\n📂 FILE LOCATIONS:")
-            print(f"   JSON: {self.json_filename}")
-            print(f"   CSV:  {self.csv_filename}")
-            if dashboard_created:
-                print(f"   Dashboard: {self.dashboard_filename}")
-                print(f"\n🌐 To view dashboard: Open the HTML file in your browser")
-                print(f"   Or in Jupyter: import webbrowser; webbrowser.open('{self.dashboard_filename}')")
-            
-            # Performance metrics
-            if new_jobs_count > 0:
-                jobs_per_minute = (new_jobs_count / total_time.total_seconds()) * 60
-                print(f"\n⚡ PERFORMANCE:")
-                print(f"   Jobs per minute: {jobs_per_minute:.1f}")
-                print(f"   Average time per job: {total_time.total_seconds()/new_jobs_count:.1f}s")
-            
-            print(f"\n🔄 NEXT STEPS:")
-            print(f"   1. Review the CSV file for job details")
-            if dashboard_created:
-                print(f"   2. Open dashboard for visual analysis")
-            print(f"   3. Update search keywords if needed")
-            print(f"   4. Run again for fresh updates (cache will auto-refresh)")
-            print(f"   5. Check logs for detailed operation information")
-            
-            # Display CSV preview
-            if new_jobs_count > 0:
-                print(f"\n📋 CSV PREVIEW (Latest {min(3, new_jobs_count)} jobs):")
-                try:
-                    df = pd.DataFrame(self.jobs_data)
-                    preview_df = df[['job_title', 'source', 'location', 'date_posted']].tail(min(3, new_jobs_count))
-                    print(preview_df.to_string(index=False))
-                except Exception as e:
-                    print(f"   Could not generate preview: {str(e)}")
-            
-            # Display cache information
-            print(f"\n🗄️  CACHE INFORMATION:")
-            print(f"   Cache entries: {len(self.cache)}")
-            print(f"   Run config: {self.current_run_config[:12]}...")
-            print(f"   Cache strategy: Configuration-based invalidation")
-            
-            # Display full CSV path for easy access
-            print(f"\n📁 FULL FILE PATHS:")
-            print(f"   JSON: {self.json_filename}")
-            print(f"   CSV:  {self.csv_filename}")
-            if dashboard_created:
-                print(f"   HTML: {self.dashboard_filename}")
+                        if new_jobs_count > 5:
+                            print(f"   ... and {new_jobs_count - 5} more jobs")
+                    else:
+                        print(f"\n💡 NO NEW JOBS FOUND")
+                        print("   Possible reasons:")
+                        print("   • All recent jobs already in database")
+                        print("   • No jobs matching criteria in last 14 days")
+                        print("   • Keywords may need adjustment")
+                        print("   • Cache may be serving previous results")
+            
+                    # Display file locations for easy access
+                    print(f"\n📂 FILE LOCATIONS:")
+                    print(f"   JSON: {self.json_filename}")
+                    print(f"   CSV:  {self.csv_filename}")
+                    if dashboard_created:
+                        print(f"   Dashboard: {self.dashboard_filename}")
+                        print(f"\n🌐 To view dashboard: Open the HTML file in your browser")
+                        print(f"   Or in Jupyter: import webbrowser; webbrowser.open('{self.dashboard_filename}')")
+            
+                    # Performance metrics
+                    if new_jobs_count > 0:
+                        jobs_per_minute = (new_jobs_count / total_time.total_seconds()) * 60
+                        print(f"\n⚡ PERFORMANCE:")
+                        print(f"   Jobs per minute: {jobs_per_minute:.1f}")
+                        print(f"   Average time per job: {total_time.total_seconds()/new_jobs_count:.1f}s")
+            
+                    print(f"\n🔄 NEXT STEPS:")
+                    print(f"   1. Review the CSV file for job details")
+                    if dashboard_created:
+                        print(f"   2. Open dashboard for visual analysis")
+                    print(f"   3. Update search keywords if needed")
+                    print(f"   4. Run again for fresh updates (cache will auto-refresh)")
+                    print(f"   5. Check logs for detailed operation information")
+            
+                    # Display CSV preview
+                    if new_jobs_count > 0:
+                        print(f"\n📋 CSV PREVIEW (Latest {min(3, new_jobs_count)} jobs):")
+                        try:
+                            # Plain column-aligned rows; the last few dicts are printed as-is, no DataFrame needed
+                            preview_fields = ['job_title', 'source', 'location', 'date_posted']
+                            preview_rows = [preview_fields] + [
+                                [str(job.get(field) or 'N/A') for field in preview_fields]
+                                for job in self.jobs_data[-min(3, new_jobs_count):]
+                            ]
+                            widths = [max(len(row[i]) for row in preview_rows) for i in range(len(preview_fields))]
+                            for row in preview_rows:
+                                print("  ".join(value.ljust(width) for value, width in zip(row, widths)).rstrip())
+                        except Exception as e:
+                            print(f"   Could not generate preview: {str(e)}")
+            
+                    # Display cache information
+                    print(f"\n🗄️  CACHE INFORMATION:")
+                    print(f"   Cache entries: {len(self.cache)}")
+                    print(f"   Run config: {self.current_run_config[:12]}...")
+                    print(f"   Cache strategy: Configuration-based invalidation")
+            
+                    # Display full CSV path for easy access
+                    print(f"\n📁 FULL FILE PATHS:")
+                    print(f"   JSON: {self.json_filename}")
+                    print(f"   CSV:  {self.csv_filename}")
+                    if dashboard_created:
+                        print(f"   HTML: {self.dashboard_filename}")
+            finally:
+                sys.stdout.write(summary.getvalue())
+                sys.stdout.flush()
                 
         except Exception as e:
             self.logger.error(f"Error in main execution: {str(e)}")
             print(f"❌ Fatal error: {str(e)}")
         finally:
             # Cleanup
-            if self.driver:
-                self.driver.quit()
-                self.logger.info("WebDriver closed successfully")
+            self.close()
         
         self.logger.info("=== Kenya Job Scraper v19 Finished ===")
 
 
+def _scrape_site_worker(save_path: str, site_name: str, method_name: str, use_page_cache: bool = True):
+    """Scrape one site in a child process; returns its jobs and cache entry for the parent to merge"""
+    scraper = KenyaJobScraper(save_path=save_path, worker=True, use_page_cache=use_page_cache)
+    try:
+        site_jobs = getattr(scraper, method_name)()
+        return site_jobs, scraper.cache.get(scraper.get_cache_key_with_config(site_name))
+    finally:
+        scraper.close()
+
+
 def main():
     """Main function with enhanced user interface"""
     print("="*80)
@@ -2132,10 +2951,14 @@ def main():
     
     # Configuration
     save_path = "C:\\Users\\USER\\Documents\\app\\Jobs\\"
+    args = sys.argv[1:]
+    use_page_cache = "--no-cache" not in args  # --no-cache: search every site again
+    # --site-workers N: scrape N sites at once in separate processes (default: one after another)
+    site_workers = int(args[args.index("--site-workers") + 1]) if "--site-workers" in args[:-1] else None
     
     try:
         # Initialize and run scraper
-        scraper = KenyaJobScraper(save_path=save_path)
+        scraper = KenyaJobScraper(save_path=save_path, use_page_cache=use_page_cache, site_workers=site_workers)
         scraper.run()
         
         print("\n✅ Enhanced scraping completed successfully!")